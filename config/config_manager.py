@@ -8,14 +8,51 @@
 import os
 import json
 import yaml
+import time
+import atexit
 import logging
+import threading
+import importlib.util
+from collections import deque
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 
+# 优先使用libyaml的C实现
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = logging.getLogger(__name__)
 
+# 延迟保存的合并窗口（秒）
+SAVE_DEBOUNCE_DELAY = 0.5
+
+# 最近使用文件的最大数量
+MAX_RECENT_FILES = 10
+
+# 可用接口探测结果的缓存时间（秒）
+INTERFACE_CACHE_TTL = 5.0
+
+# 默认配置文件路径（进程内不变，首次使用时计算）
+_DEFAULT_CONFIG_PATH: Optional[str] = None
+
+# 本进程中已确认存在的配置目录
+_ENSURED_DIRS = set()
+
+# 可选驱动模块是否已安装（只探测一次）
+_MODULE_AVAILABLE: Dict[str, bool] = {}
+
+def _is_module_available(name: str) -> bool:
+    """检查可选模块是否已安装，结果在进程内缓存"""
+    available = _MODULE_AVAILABLE.get(name)
+    if available is None:
+        available = importlib.util.find_spec(name) is not None
+        _MODULE_AVAILABLE[name] = available
+    return available
+
 class CANInterfaceType(Enum):
     """CAN接口类型枚举"""
     PCAN = "pcan"
@@ -40,6 +77,27 @@ class FrameType(Enum):
     STANDARD = "standard"
     EXTENDED = "extended"
 
+# 枚举值到成员的直接映射，跳过Enum.__call__的查找流程
+_CAN_INTERFACE_TYPE_BY_VALUE: Dict[str, CANInterfaceType] = {m.value: m for m in CANInterfaceType}
+_FRAME_TYPE_BY_VALUE: Dict[str, FrameType] = {m.value: m for m in FrameType}
+
+# 数据类字段名缓存，避免每次序列化都重新内省
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+def _dataclass_to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    将扁平数据类转换为字典
+    
+    配置类的字段都是基本类型，直接按字段取值即可，
+    不需要asdict的递归深拷贝
+    """
+    cls = type(obj)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls))
+        _FIELD_NAMES[cls] = names
+    return {name: getattr(obj, name) for name in names}
+
 @dataclass
 class CANInterfaceConfig:
     """CAN接口配置"""
@@ -74,7 +132,7 @@ class CANInterfaceConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        data = asdict(self)
+        data = _dataclass_to_dict(self)
         data['interface_type'] = self.interface_type.value
         return data
     
@@ -82,7 +140,9 @@ class CANInterfaceConfig:
     def from_dict(cls, data: Dict[str, Any]) -> 'CANInterfaceConfig':
         """从字典创建"""
         if 'interface_type' in data:
-            data['interface_type'] = CANInterfaceType(data['interface_type'])
+            value = data['interface_type']
+            member = _CAN_INTERFACE_TYPE_BY_VALUE.get(value)
+            data['interface_type'] = member if member is not None else CANInterfaceType(value)
         return cls(**data)
 
 @dataclass
@@ -112,7 +172,7 @@ class UDSConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        data = asdict(self)
+        data = _dataclass_to_dict(self)
         data['frame_type'] = self.frame_type.value
         return data
     
@@ -120,7 +180,9 @@ class UDSConfig:
     def from_dict(cls, data: Dict[str, Any]) -> 'UDSConfig':
         """从字典创建"""
         if 'frame_type' in data:
-            data['frame_type'] = FrameType(data['frame_type'])
+            value = data['frame_type']
+            member = _FRAME_TYPE_BY_VALUE.get(value)
+            data['frame_type'] = member if member is not None else FrameType(value)
         return cls(**data)
 
 @dataclass
@@ -136,6 +198,14 @@ class MonitorConfig:
     save_to_file: bool = False
     save_path: str = ""
     file_max_size: int = 100  # MB
+
+# 导入时预先缓存配置类的字段名，首次保存时无需再内省
+for _config_cls in (CANInterfaceConfig, UDSConfig, MonitorConfig):
+    _FIELD_NAMES[_config_cls] = tuple(f.name for f in fields(_config_cls))
+del _config_cls
+
+# 监控配置的合法字段名，加载时忽略未知键
+_MONITOR_FIELDS = frozenset(_FIELD_NAMES[MonitorConfig])
     
 class ConfigManager:
     """配置管理器"""
@@ -149,9 +219,13 @@ class ConfigManager:
         """
         self.config_path = config_path or self._get_default_config_path()
         self.config_dir = Path(self.config_path).parent
+        self.user_settings_path = str(self.config_dir / "user_settings.json")
         
         # 确保配置目录存在
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        config_dir_key = str(self.config_dir)
+        if config_dir_key not in _ENSURED_DIRS:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(config_dir_key)
         
         # 默认配置
         self.can_config = CANInterfaceConfig()
@@ -160,7 +234,7 @@ class ConfigManager:
         
         # 用户配置
         self.user_settings: Dict[str, Any] = {
-            'recent_files': [],
+            'recent_files': deque(maxlen=MAX_RECENT_FILES),
             'window_geometry': None,
             'window_state': None,
             'theme': 'light',
@@ -169,19 +243,38 @@ class ConfigManager:
             'start_minimized': False,
         }
         
+        # 最近使用文件的成员索引
+        self._recent_set = set()
+        
+        # 延迟保存状态
+        self._dirty = False
+        self._saved_hashes: Dict[str, int] = {}
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        
+        # 可用接口缓存: (探测时间, 接口列表)
+        self._iface_cache: Optional[Tuple[float, List[Tuple[str, str]]]] = None
+        
         # 加载配置
         self.load_config()
         
+        # 退出时写入尚未保存的修改
+        atexit.register(self.flush)
+        
     def _get_default_config_path(self) -> str:
         """获取默认配置文件路径"""
-        if os.name == 'nt':  # Windows
-            config_dir = Path.home() / "AppData" / "Local" / "UDSTool"
-        elif os.name == 'posix':  # Linux/macOS
-            config_dir = Path.home() / ".config" / "udstool"
-        else:
-            config_dir = Path.cwd() / "config"
+        global _DEFAULT_CONFIG_PATH
+        if _DEFAULT_CONFIG_PATH is None:
+            if os.name == 'nt':  # Windows
+                config_dir = os.path.join(os.path.expanduser('~'), "AppData", "Local", "UDSTool")
+            elif os.name == 'posix':  # Linux/macOS
+                config_dir = os.path.join(os.path.expanduser('~'), ".config", "udstool")
+            else:
+                config_dir = os.path.join(os.getcwd(), "config")
+            
+            _DEFAULT_CONFIG_PATH = os.path.join(config_dir, "config.yaml")
         
-        return str(config_dir / "config.yaml")
+        return _DEFAULT_CONFIG_PATH
     
     def save_config(self) -> bool:
         """保存配置到文件"""
@@ -190,48 +283,98 @@ class ConfigManager:
                 'version': '1.0',
                 'can_config': self.can_config.to_dict(),
                 'uds_config': self.uds_config.to_dict(),
-                'monitor_config': asdict(self.monitor_config),
-                'user_settings': self.user_settings,
+                'monitor_config': _dataclass_to_dict(self.monitor_config),
             }
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+            content = yaml.dump(config_data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
+            if self._write_if_changed(self.config_path, content):
+                logger.info(f"Configuration saved to {self.config_path}")
             
-            logger.info(f"Configuration saved to {self.config_path}")
-            return True
+            return self.save_user_settings()
             
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             return False
     
+    def save_user_settings(self) -> bool:
+        """保存用户设置（JSON格式，频繁修改的设置不经过YAML）"""
+        try:
+            settings = dict(self.user_settings)
+            settings['recent_files'] = list(settings['recent_files'])
+            content = json.dumps(settings, ensure_ascii=False, separators=(',', ':'))
+            if self._write_if_changed(self.user_settings_path, content):
+                logger.debug(f"User settings saved to {self.user_settings_path}")
+            
+            self._dirty = False
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to save user settings: {e}")
+            return False
+    
+    def _write_if_changed(self, path: str, content: str) -> bool:
+        """
+        写入文件内容，内容与上次写入相同时跳过
+        
+        Returns:
+            是否实际写入了文件
+        """
+        content_hash = hash(content)
+        if self._saved_hashes.get(path) == content_hash:
+            return False
+        
+        # 先写临时文件再原子替换，避免写入中断留下损坏的配置文件
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        self._saved_hashes[path] = content_hash
+        return True
+    
     def load_config(self) -> bool:
         """从文件加载配置"""
         try:
             if not os.path.exists(self.config_path):
                 logger.info(f"Configuration file not found, using defaults: {self.config_path}")
+                self._load_user_settings()
                 return False
             
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=_YamlLoader)
             
-            if not config_data:
+            if not config_data or not isinstance(config_data, dict):
+                self._load_user_settings()
                 return False
             
-            # 加载CAN配置
-            if 'can_config' in config_data:
-                self.can_config = CANInterfaceConfig.from_dict(config_data['can_config'])
+            can_data = config_data.get('can_config')
+            uds_data = config_data.get('uds_config')
+            monitor_data = config_data.get('monitor_config')
+            user_data = config_data.get('user_settings')
             
-            # 加载UDS配置
-            if 'uds_config' in config_data:
-                self.uds_config = UDSConfig.from_dict(config_data['uds_config'])
+            # 先构建全部配置，任一部分格式错误都不会留下部分加载的状态
+            can_config = CANInterfaceConfig.from_dict(can_data) if can_data else None
+            uds_config = UDSConfig.from_dict(uds_data) if uds_data else None
+            monitor_config = MonitorConfig(
+                **{k: v for k, v in monitor_data.items() if k in _MONITOR_FIELDS}
+            ) if monitor_data else None
             
-            # 加载监控配置
-            if 'monitor_config' in config_data:
-                self.monitor_config = MonitorConfig(**config_data['monitor_config'])
+            if can_config is not None:
+                self.can_config = can_config
+            if uds_config is not None:
+                self.uds_config = uds_config
+            if monitor_config is not None:
+                self.monitor_config = monitor_config
             
-            # 加载用户设置
-            if 'user_settings' in config_data:
-                self.user_settings.update(config_data['user_settings'])
+            # 加载用户设置（旧版本保存在YAML中，JSON文件存在时以其为准）
+            if user_data:
+                self.user_settings.update(user_data)
+            self._load_user_settings()
             
             logger.info(f"Configuration loaded from {self.config_path}")
             return True
@@ -240,39 +383,61 @@ class ConfigManager:
             logger.error(f"Failed to load configuration: {e}")
             return False
     
+    def _load_user_settings(self) -> None:
+        """从JSON文件加载用户设置"""
+        if os.path.exists(self.user_settings_path):
+            try:
+                with open(self.user_settings_path, 'r', encoding='utf-8') as f:
+                    settings = json.load(f)
+                
+                if isinstance(settings, dict):
+                    self.user_settings.update(settings)
+                    
+            except Exception as e:
+                logger.error(f"Failed to load user settings: {e}")
+        
+        # 文件中保存的是列表，恢复为定长双端队列
+        recent_files = deque(self.user_settings.get('recent_files') or (), maxlen=MAX_RECENT_FILES)
+        self.user_settings['recent_files'] = recent_files
+        self._recent_set = set(recent_files)
+    
     def get_available_interfaces(self) -> List[Tuple[str, str]]:
         """获取可用CAN接口列表"""
+        cache = self._iface_cache
+        if cache is not None and time.monotonic() - cache[0] < INTERFACE_CACHE_TTL:
+            return list(cache[1])
+        
         interfaces = []
         
-        try:
-            import can
-            
-            # 获取python-can检测到的接口
-            can_interfaces = can.detect_available_configs()
-            for interface in can_interfaces:
-                interface_str = f"{interface['interface']} - {interface.get('channel', 'N/A')}"
-                interfaces.append((interface['interface'], interface_str))
+        if _is_module_available('can'):
+            try:
+                import can
                 
-        except ImportError:
+                # 获取python-can检测到的接口
+                can_interfaces = can.detect_available_configs()
+                for interface in can_interfaces:
+                    interface_str = f"{interface['interface']} - {interface.get('channel', 'N/A')}"
+                    interfaces.append((interface['interface'], interface_str))
+                    
+            except Exception as e:
+                logger.error(f"Error detecting interfaces: {e}")
+        else:
             logger.error("python-can not installed")
-        except Exception as e:
-            logger.error(f"Error detecting interfaces: {e}")
         
         # 添加NI XNET接口
-        try:
-            import nixnet
-            from nixnet import constants
-            import nixnet._funcs
-            
-            # 获取NI XNET接口
-            ni_interfaces = nixnet._funcs.get_interface_refs()
-            for intf in ni_interfaces:
-                interfaces.append(('ni_xnet', f"NI XNET - {intf}"))
+        if _is_module_available('nixnet'):
+            try:
+                import nixnet._funcs
                 
-        except ImportError:
+                # 获取NI XNET接口
+                ni_interfaces = nixnet._funcs.get_interface_refs()
+                for intf in ni_interfaces:
+                    interfaces.append(('ni_xnet', f"NI XNET - {intf}"))
+                    
+            except Exception as e:
+                logger.debug(f"NI XNET detection failed: {e}")
+        else:
             logger.debug("NI XNET not available")
-        except Exception as e:
-            logger.debug(f"NI XNET detection failed: {e}")
         
         # 如果没有检测到接口，添加虚拟接口
         if not interfaces:
@@ -284,22 +449,48 @@ class ConfigManager:
                 ('kvaser', 'Kvaser (需要Kvaser驱动)'),
             ]
         
-        return interfaces
+        self._iface_cache = (time.monotonic(), interfaces)
+        return list(interfaces)
     
     def add_recent_file(self, file_path: str) -> None:
         """添加最近使用的文件"""
-        if file_path in self.user_settings['recent_files']:
-            self.user_settings['recent_files'].remove(file_path)
+        recent_files = self.user_settings['recent_files']
         
-        self.user_settings['recent_files'].insert(0, file_path)
+        if file_path in self._recent_set:
+            if recent_files[0] == file_path:
+                return
+            recent_files.remove(file_path)
+        elif len(recent_files) == recent_files.maxlen:
+            # 队列已满，最旧的文件将被挤出
+            self._recent_set.discard(recent_files[-1])
         
-        # 限制最近文件数量
-        if len(self.user_settings['recent_files']) > 10:
-            self.user_settings['recent_files'] = self.user_settings['recent_files'][:10]
+        recent_files.appendleft(file_path)
+        self._recent_set.add(file_path)
         
-        self.save_config()
+        self._schedule_save()
     
     def clear_recent_files(self) -> None:
         """清除最近使用的文件"""
-        self.user_settings['recent_files'] = []
-        self.save_config()
\ No newline at end of file
+        self.user_settings['recent_files'].clear()
+        self._recent_set.clear()
+        self.save_user_settings()
+    
+    def _schedule_save(self) -> None:
+        """标记用户设置已修改，并在合并窗口结束后统一保存"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> bool:
+        """立即保存尚未写入的配置修改"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            return self.save_user_settings()
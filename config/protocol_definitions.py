@@ -5,9 +5,12 @@ UDS协议定义 - 完整的UDS服务定义和子功能
 基于ISO 14229-1:2020标准
 """
 
+import sys
+import functools
 from enum import IntEnum, Enum
-from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Sequence, Tuple
 
 class UDSServiceID(IntEnum):
     """UDS服务ID枚举"""
@@ -103,13 +106,15 @@ class ControlDTCSettingType(IntEnum):
     OFF = 0x02
 
 class LinkControlType(IntEnum):
-):
     """链接控制类型"""
     VERIFY_BAUDRATE_TRANSITION_WITH_FIXED_BAUDRATE = 0x01
     VERIFY_BAUDRATE_TRANSITION_WITH_SPECIFIC_BAUDRATE = 0x02
     TRANSITION_BAUDRATE = 0x03
 
-@dataclass
+# Python 3.10+ 的数据类支持slots，旧版本退回普通数据类
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class UDSServiceDefinition:
     """UDS服务定义"""
     service_id: int
@@ -121,427 +126,514 @@ class UDSServiceDefinition:
     supports_fd: bool = True
     min_length: int = 1
     max_length: int = 4095
+    # 子功能键连续且较小时使用的直接索引表（由subfunctions生成）
+    _subfunction_table: Optional[Tuple[Optional[str], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
-class ProtocolDefinitions:
-    """协议定义管理器"""
+    def __post_init__(self):
+        object.__setattr__(self, '_subfunction_table', _build_subfunction_table(self.subfunctions))
     
-    def __init__(self):
-        self.services: Dict[int, UDSServiceDefinition] = self._initialize_services()
-        self.data_identifiers: Dict[int, str] = self._initialize_data_identifiers()
-        
-    def _initialize_services(self) -> Dict[int, UDSServiceDefinition]:
-        """初始化UDS服务定义"""
-        services = {}
-        
-        # 1. Diagnostic Session Control (0x10)
-        services[0x10] = UDSServiceDefinition(
-            service_id=0x10,
-            name="DiagnosticSessionControl",
-            description="诊断会话控制",
-            request_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),  # session_type
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-                ("p2_server_max", "uint16"),
-                ("p2_star_server_max", "uint16"),
-            ],
-            subfunctions={
-                0x01: "Default Session",
-                0x02: "Programming Session",
-                0x03: "Extended Diagnostic Session",
-                0x04: "Safety System Diagnostic Session",
-                0x40: "Manufacturer Specific 1",
-                0x41: "Manufacturer Specific 2",
-                0x42: "Manufacturer Specific 3",
-                0x43: "Manufacturer Specific 4",
-            }
-        )
-        
-        # 2. ECU Reset (0x11)
-        services[0x11] = UDSServiceDefinition(
-            service_id=0x11,
-            name="ECUReset",
-            description="ECU复位",
-            request_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),  # reset_type
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-                ("power_down_time", "uint8"),
-            ],
-            subfunctions={
-                0x01: "Hard Reset",
-                0x02: "Key Off On Reset",
-                0x03: "Soft Reset",
-                0x04: "Enable Rapid Power Shutdown",
-                0x05: "Disable Rapid Power Shutdown",
-            }
-        )
-        
-        # 3. Clear Diagnostic Information (0x14)
-        services[0x14] = UDSServiceDefinition(
-            service_id=0x14,
-            name="ClearDiagnosticInformation",
-            description="清除诊断信息",
-            request_format=[
-                ("service_id", "uint8"),
-                ("group_of_dtc", "uint24"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-            ]
-        )
-        
-        # 4. Read DTC Information (0x19)
-        dtc_subfunctions = {
-            0x01: "reportNumberOfDTCByStatusMask",
-            0x02: "reportDTCByStatusMask",
-            0x03: "reportDTCSnapshotIdentification",
-            0x04: "reportDTCSnapshotRecordByDTCNumber",
-            0x05: "reportDTCExtendedDataRecordByDTCNumber",
-            0x06: "reportNumberOfDTCBySeverityMaskRecord",
-            0x07: "reportDTCBySeverityMaskRecord",
-            0x08: "reportSeverityInformationOfDTC",
-            0x09: "reportSupportedDTC",
-            0x0A: "reportFirstTestFailedDTC",
-            0x0B: "reportFirstConfirmedDTC",
-            0x0C: "reportMostRecentTestFailedDTC",
-            0x0D: "reportMostRecentConfirmedDTC",
-            0x0E: "reportMirrorMemoryDTCByStatusMask",
-            0x0F: "reportMirrorMemoryDTCExtendedDataRecordByDTCNumber",
-            0x10: "reportNumberOfMirrorMemoryDTCByStatusMask",
-            0x11: "reportNumberOfEmissionsRelatedOBDDTCByStatusMask",
-            0x12: "reportEmissionsRelatedOBDDTCByStatusMask",
-            0x13: "reportDTCFaultDetectionCounter",
-            0x14: "reportDTCWithPermanentStatus",
-            0x15: "reportDTCExtendedDataRecordByRecordNumber",
-            0x16: "reportUserDefinedMemoryDTCByStatusMask",
-            0x17: "reportUserDefinedMemoryDTCExtendedDataRecordByDTCNumber",
-            0x18: "reportNumberOfUserDefinedMemoryDTCByStatusMask",
-            0x19: "reportManufacturerDefinedDTCByStatusMask",
+    def get_subfunction(self, subfunction: int) -> Optional[str]:
+        """获取子功能名称"""
+        table = self._subfunction_table
+        if table is not None:
+            if 0 <= subfunction < len(table):
+                return table[subfunction]
+            return None
+        if self.subfunctions:
+            return self.subfunctions.get(subfunction)
+        return None
+
+def _build_subfunction_table(subfunctions: Optional[Dict[int, str]]) -> Optional[Tuple[Optional[str], ...]]:
+    """
+    为键密集的子功能字典构建按子功能ID索引的元组
+    
+    键范围稀疏时（如TesterPresent的0x00/0x80）返回None，继续使用字典查找
+    """
+    if not subfunctions:
+        return None
+    
+    size = max(subfunctions) + 1
+    if min(subfunctions) < 0 or size > 2 * len(subfunctions):
+        return None
+    
+    table: List[Optional[str]] = [None] * size
+    for subfunction_id, name in subfunctions.items():
+        table[subfunction_id] = name
+    return tuple(table)
+
+def _intern_names(service_def: UDSServiceDefinition) -> UDSServiceDefinition:
+    """驻留服务名和子功能名字符串，使相同名称共享同一对象"""
+    subfunctions = service_def.subfunctions
+    if subfunctions:
+        subfunctions = {sf: sys.intern(name) for sf, name in subfunctions.items()}
+    return replace(service_def, name=sys.intern(service_def.name), subfunctions=subfunctions)
+    
+def _build_services() -> Dict[int, UDSServiceDefinition]:
+    """初始化UDS服务定义"""
+    services = {}
+    
+    # 1. Diagnostic Session Control (0x10)
+    services[0x10] = UDSServiceDefinition(
+        service_id=0x10,
+        name="DiagnosticSessionControl",
+        description="诊断会话控制",
+        request_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),  # session_type
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+            ("p2_server_max", "uint16"),
+            ("p2_star_server_max", "uint16"),
+        ],
+        subfunctions={
+            0x01: "Default Session",
+            0x02: "Programming Session",
+            0x03: "Extended Diagnostic Session",
+            0x04: "Safety System Diagnostic Session",
+            0x40: "Manufacturer Specific 1",
+            0x41: "Manufacturer Specific 2",
+            0x42: "Manufacturer Specific 3",
+            0x43: "Manufacturer Specific 4",
         }
+    )
+    
+    # 2. ECU Reset (0x11)
+    services[0x11] = UDSServiceDefinition(
+        service_id=0x11,
+        name="ECUReset",
+        description="ECU复位",
+        request_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),  # reset_type
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+            ("power_down_time", "uint8"),
+        ],
+        subfunctions={
+            0x01: "Hard Reset",
+            0x02: "Key Off On Reset",
+            0x03: "Soft Reset",
+            0x04: "Enable Rapid Power Shutdown",
+            0x05: "Disable Rapid Power Shutdown",
+        }
+    )
+    
+    # 3. Clear Diagnostic Information (0x14)
+    services[0x14] = UDSServiceDefinition(
+        service_id=0x14,
+        name="ClearDiagnosticInformation",
+        description="清除诊断信息",
+        request_format=[
+            ("service_id", "uint8"),
+            ("group_of_dtc", "uint24"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+        ]
+    )
+    
+    # 4. Read DTC Information (0x19)
+    dtc_subfunctions = {
+        0x01: "reportNumberOfDTCByStatusMask",
+        0x02: "reportDTCByStatusMask",
+        0x03: "reportDTCSnapshotIdentification",
+        0x04: "reportDTCSnapshotRecordByDTCNumber",
+        0x05: "reportDTCExtendedDataRecordByDTCNumber",
+        0x06: "reportNumberOfDTCBySeverityMaskRecord",
+        0x07: "reportDTCBySeverityMaskRecord",
+        0x08: "reportSeverityInformationOfDTC",
+        0x09: "reportSupportedDTC",
+        0x0A: "reportFirstTestFailedDTC",
+        0x0B: "reportFirstConfirmedDTC",
+        0x0C: "reportMostRecentTestFailedDTC",
+        0x0D: "reportMostRecentConfirmedDTC",
+        0x0E: "reportMirrorMemoryDTCByStatusMask",
+        0x0F: "reportMirrorMemoryDTCExtendedDataRecordByDTCNumber",
+        0x10: "reportNumberOfMirrorMemoryDTCByStatusMask",
+        0x11: "reportNumberOfEmissionsRelatedOBDDTCByStatusMask",
+        0x12: "reportEmissionsRelatedOBDDTCByStatusMask",
+        0x13: "reportDTCFaultDetectionCounter",
+        0x14: "reportDTCWithPermanentStatus",
+        0x15: "reportDTCExtendedDataRecordByRecordNumber",
+        0x16: "reportUserDefinedMemoryDTCByStatusMask",
+        0x17: "reportUserDefinedMemoryDTCExtendedDataRecordByDTCNumber",
+        0x18: "reportNumberOfUserDefinedMemoryDTCByStatusMask",
+        0x19: "reportManufacturerDefinedDTCByStatusMask",
+    }
+    
+    services[0x19] = UDSServiceDefinition(
+        service_id=0x19,
+        name="ReadDTCInformation",
+        description="读取DTC信息",
+        request_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+        ],
+        subfunctions=dtc_subfunctions
+    )
+    
+    # 5. Read Data By Identifier (0x22)
+    services[0x22] = UDSServiceDefinition(
+        service_id=0x22,
+        name="ReadDataByIdentifier",
+        description="通过标识符读取数据",
+        request_format=[
+            ("service_id", "uint8"),
+            ("data_identifier", "uint16"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("data_identifier", "uint16"),
+            ("data_record", "bytes"),
+        ]
+    )
+    
+    # 6. Read Memory By Address (0x23)
+    services[0x23] = UDSServiceDefinition(
+        service_id=0x23,
+        name="ReadMemoryByAddress",
+        description="通过地址读取内存",
+        request_format=[
+            ("service_id", "uint8"),
+            ("memory_address", "uint32"),
+            ("memory_size", "uint24"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("data_record", "bytes"),
+        ]
+    )
+    
+    # 7. Read Scaling Data By Identifier (0x24)
+    services[0x24] = UDSServiceDefinition(
+        service_id=0x24,
+        name="ReadScalingDataByIdentifier",
+        description="通过标识符读取缩放数据",
+        request_format=[
+            ("service_id", "uint8"),
+            ("data_identifier", "uint16"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("data_identifier", "uint16"),
+            ("scaling_byte", "uint8"),
+            ("data_record", "bytes"),
+        ]
+    )
+    
+    # 8. Security Access (0x27)
+    services[0x27] = UDSServiceDefinition(
+        service_id=0x27,
+        name="SecurityAccess",
+        description="安全访问",
+        request_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),  # 奇数：请求种子，偶数：发送密钥
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+            ("security_seed_or_key", "bytes"),
+        ],
+        subfunctions={
+            0x01: "Request Seed",
+            0x02: "Send Key",
+            0x03: "Request Seed (level 2)",
+            0x04: "Send Key (level 2)",
+            0x05: "Request Seed (level 3)",
+            0x06: "Send Key (level 3)",
+            0x07: "Request Seed (level 4)",
+            0x08: "Send Key (level 4)",
+            0x09: "Request Seed (level 5)",
+            0x0A: "Send Key (level 5)",
+        }
+    )
+    
+    # 9. Communication Control (0x28)
+    services[0x28] = UDSServiceDefinition(
+        service_id=0x28,
+        name="CommunicationControl",
+        description="通信控制",
+        request_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),  # control_type
+            ("communication_type", "uint8"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+        ],
+        subfunctions={
+            0x00: "Enable Rx and Tx",
+            0x01: "Enable Rx Disable Tx",
+            0x02: "Disable Rx Enable Tx",
+            0x03: "Disable Rx and Tx",
+            0x04: "Enable Rx Disable Tx with Enhanced Address",
+            0x05: "Disable Rx Enable Tx with Enhanced Address",
+        }
+    )
+    
+    # 10. Tester Present (0x3E)
+    services[0x3E] = UDSServiceDefinition(
+        service_id=0x3E,
+        name="TesterPresent",
+        description="测试器保持连接",
+        request_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+        ],
+        subfunctions={
+            0x00: "Zero Sub-function",
+            0x80: "Suppress Positive Response",
+        }
+    )
+    
+    # 11. Write Data By Identifier (0x2E)
+    services[0x2E] = UDSServiceDefinition(
+        service_id=0x2E,
+        name="WriteDataByIdentifier",
+        description="通过标识符写入数据",
+        request_format=[
+            ("service_id", "uint8"),
+            ("data_identifier", "uint16"),
+            ("data_record", "bytes"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("data_identifier", "uint16"),
+        ]
+    )
+    
+    # 12. Routine Control (0x31)
+    services[0x31] = UDSServiceDefinition(
+        service_id=0x31,
+        name="RoutineControl",
+        description="例程控制",
+        request_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+            ("routine_identifier", "uint16"),
+            ("routine_control_option_record", "bytes"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("subfunction", "uint8"),
+            ("routine_identifier", "uint16"),
+            ("routine_status_record", "bytes"),
+        ],
+        subfunctions={
+            0x01: "Start Routine",
+            0x02: "Stop Routine",
+            0x03: "Request Routine Results",
+        }
+    )
+    
+    # 13. Request Download (0x34)
+    services[0x34] = UDSServiceDefinition(
+        service_id=0x34,
+        name="RequestDownload",
+        description="请求下载",
+        request_format=[
+            ("service_id", "uint8"),
+            ("data_format_identifier", "uint8"),
+            ("memory_address", "uint32"),
+            ("memory_size", "uint32"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("length_format_identifier", "uint8"),
+            ("max_number_of_blocks", "uint32"),
+        ]
+    )
+    
+    # 14. Request Upload (0x35)
+    services[0x35] = UDSServiceDefinition(
+        service_id=0x35,
+        name="RequestUpload",
+        description="请求上传",
+        request_format=[
+            ("service_id", "uint8"),
+            ("data_format_identifier", "uint8"),
+            ("memory_address", "uint32"),
+            ("memory_size", "uint32"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("length_format_identifier", "uint8"),
+            ("max_number_of_blocks", "uint32"),
+        ]
+    )
+    
+    # 15. Transfer Data (0x36)
+    services[0x36] = UDSServiceDefinition(
+        service_id=0x36,
+        name="TransferData",
+        description="传输数据",
+        request_format=[
+            ("service_id", "uint8"),
+            ("block_sequence_counter", "uint8"),
+            ("transfer_request_data_record", "bytes"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+            ("block_sequence_counter", "uint8"),
+            ("transfer_response_data_record", "bytes"),
+        ]
+    )
+    
+    # 16. Request Transfer Exit (0x37)
+    services[0x37] = UDSServiceDefinition(
+        service_id=0x37,
+        name="RequestTransferExit",
+        description="请求传输退出",
+        request_format=[
+            ("service_id", "uint8"),
+        ],
+        response_format=[
+            ("service_id", "uint8"),
+        ]
+    )
+    
+    return {service_id: _intern_names(service_def) for service_id, service_def in services.items()}
+
+def _build_data_identifiers() -> Dict[int, str]:
+    """初始化数据标识符定义"""
+    # ISO 14229-1 标准数据标识符
+    data_ids = {
+        # ECU识别信息
+        0xF180: "ECU Identification",
+        0xF181: "VIN",
+        0xF182: "Vehicle Manufacturer Name",
+        0xF183: "Vehicle Make",
+        0xF184: "Vehicle Model",
+        0xF185: "Vehicle Model Year",
+        0xF186: "Vehicle Trim Level",
+        0xF187: "ECU Hardware Number",
+        0xF188: "ECU Software Number",
+        0xF189: "ECU Manufacturing Date",
+        0xF18A: "ECU Serial Number",
+        0xF18B: "System Name",
+        0xF18C: "System Supplier",
         
-        services[0x19] = UDSServiceDefinition(
-            service_id=0x19,
-            name="ReadDTCInformation",
-            description="读取DTC信息",
-            request_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-            ],
-            subfunctions=dtc_subfunctions
-        )
-        
-        # 5. Read Data By Identifier (0x22)
-        services[0x22] = UDSServiceDefinition(
-            service_id=0x22,
-            name="ReadDataByIdentifier",
-            description="通过标识符读取数据",
-            request_format=[
-                ("service_id", "uint8"),
-                ("data_identifier", "uint16"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("data_identifier", "uint16"),
-                ("data_record", "bytes"),
-            ]
-        )
-        
-        # 6. Read Memory By Address (0x23)
-        services[0x23] = UDSServiceDefinition(
-            service_id=0x23,
-            name="ReadMemoryByAddress",
-            description="通过地址读取内存",
-            request_format=[
-                ("service_id", "uint8"),
-                ("memory_address", "uint32"),
-                ("memory_size", "uint24"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("data_record", "bytes"),
-            ]
-        )
-        
-        # 7. Read Scaling Data By Identifier (0x24)
-        services[0x24] = UDSServiceDefinition(
-            service_id=0x24,
-            name="ReadScalingDataByIdentifier",
-            description="通过标识符读取缩放数据",
-            request_format=[
-                ("service_id", "uint8"),
-                ("data_identifier", "uint16"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("data_identifier", "uint16"),
-                ("scaling_byte", "uint8"),
-                ("data_record", "bytes"),
-            ]
-        )
-        
-        # 8. Security Access (0x27)
-        services[0x27] = UDSServiceDefinition(
-            service_id=0x27,
-            name="SecurityAccess",
-            description="安全访问",
-            request_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),  # 奇数：请求种子，偶数：发送密钥
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-                ("security_seed_or_key", "bytes"),
-            ],
-            subfunctions={
-                0x01: "Request Seed",
-                0x02: "Send Key",
-                0x03: "Request Seed (level 2)",
-                0x04: "Send Key (level 2)",
-                0x05: "Request Seed (level 3)",
-                0x06: "Send Key (level 3)",
-                0x07: "Request Seed (level 4)",
-                0x08: "Send Key (level 4)",
-                0x09: "Request Seed (level 5)",
-                0x0A: "Send Key (level 5)",
-            }
-        )
-        
-        # 9. Communication Control (0x28)
-        services[0x28] = UDSServiceDefinition(
-            service_id=0x28,
-            name="CommunicationControl",
-            description="通信控制",
-            request_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),  # control_type
-                ("communication_type", "uint8"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-            ],
-            subfunctions={
-                0x00: "Enable Rx and Tx",
-                0x01: "Enable Rx Disable Tx",
-                0x02: "Disable Rx Enable Tx",
-                0x03: "Disable Rx and Tx",
-                0x04: "Enable Rx Disable Tx with Enhanced Address",
-                0x05: "Disable Rx Enable Tx with Enhanced Address",
-            }
-        )
-        
-        # 10. Tester Present (0x3E)
-        services[0x3E] = UDSServiceDefinition(
-            service_id=0x3E,
-            name="TesterPresent",
-            description="测试器保持连接",
-            request_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-            ],
-            subfunctions={
-                0x00: "Zero Sub-function",
-                0x80: "Suppress Positive Response",
-            }
-        )
-        
-        # 11. Write Data By Identifier (0x2E)
-        services[0x2E] = UDSServiceDefinition(
-            service_id=0x2E,
-            name="WriteDataByIdentifier",
-            description="通过标识符写入数据",
-            request_format=[
-                ("service_id", "uint8"),
-                ("data_identifier", "uint16"),
-                ("data_record", "bytes"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("data_identifier", "uint16"),
-            ]
-        )
-        
-        # 12. Routine Control (0x31)
-        services[0x31] = UDSServiceDefinition(
-            service_id=0x31,
-            name="RoutineControl",
-            description="例程控制",
-            request_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-                ("routine_identifier", "uint16"),
-                ("routine_control_option_record", "bytes"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("subfunction", "uint8"),
-                ("routine_identifier", "uint16"),
-                ("routine_status_record", "bytes"),
-            ],
-            subfunctions={
-                0x01: "Start Routine",
-                0x02: "Stop Routine",
-                0x03: "Request Routine Results",
-            }
-        )
-        
-        # 13. Request Download (0x34)
-        services[0x34] = UDSServiceDefinition(
-            service_id=0x34,
-            name="RequestDownload",
-            description="请求下载",
-            request_format=[
-                ("service_id", "uint8"),
-                ("data_format_identifier", "uint8"),
-                ("memory_address", "uint32"),
-                ("memory_size", "uint32"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("length_format_identifier", "uint8"),
-                ("max_number_of_blocks", "uint32"),
-            ]
-        )
-        
-        # 14. Request Upload (0x35)
-        services[0x35] = UDSServiceDefinition(
-            service_id=0x35,
-            name="RequestUpload",
-            description="请求上传",
-            request_format=[
-                ("service_id", "uint8"),
-                ("data_format_identifier", "uint8"),
-                ("memory_address", "uint32"),
-                ("memory_size", "uint32"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("length_format_identifier", "uint8"),
-                ("max_number_of_blocks", "uint32"),
-            ]
-        )
+        # 诊断信息
+        0xF190: "Active Diagnostic Session",
+        0xF191: "Boot Software Identification",
+        0xF192: "Application Software Identification",
+        0xF193: "Application Data Identification",
+        0xF194: "Bootloader Software Identification",
+        0xF195: "Calibration Identification",
+        0xF196: "Calibration Verification Numbers",
+        0xF197: "ECU Diagnostic Address",
+        0xF198: "ECU Name",
+        0xF199: "Programming Date",
         
-        # 15. Transfer Data (0x36)
-        services[0x36] = UDSServiceDefinition(
-            service_id=0x36,
-            name="TransferData",
-            description="传输数据",
-            request_format=[
-                ("service_id", "uint8"),
-                ("block_sequence_counter", "uint8"),
-                ("transfer_request_data_record", "bytes"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-                ("block_sequence_counter", "uint8"),
-                ("transfer_response_data_record", "bytes"),
-            ]
-        )
+        # 网络管理
+        0xF1A0: "CAN Network Configuration",
+        0xF1A1: "LIN Network Configuration",
+        0xF1A2: "FlexRay Network Configuration",
+        0xF1A3: "Ethernet Network Configuration",
         
-        # 16. Request Transfer Exit (0x37)
-        services[0x37] = UDSServiceDefinition(
-            service_id=0x37,
-            name="RequestTransferExit",
-            description="请求传输退出",
-            request_format=[
-                ("service_id", "uint8"),
-            ],
-            response_format=[
-                ("service_id", "uint8"),
-            ]
-        )
+        # 安全信息
+        0xF1B0: "Security Access Configuration",
+        0xF1B1: "Security Certificate",
+        0xF1B2: "Security Key",
         
-        return services
+        # 制造商特定范围
+        0xF200: "Manufacturer Specific 1",
+        0xF201: "Manufacturer Specific 2",
+        0xF202: "Manufacturer Specific 3",
+        0xF203: "Manufacturer Specific 4",
+        0xF204: "Manufacturer Specific 5",
+        0xF205: "Manufacturer Specific 6",
+    }
     
-    def _initialize_data_identifiers(self) -> Dict[int, str]:
-        """初始化数据标识符定义"""
-        data_ids = {}
-        
-        # ISO 14229-1 标准数据标识符
-        data_ids.update({
-            # ECU识别信息
-            0xF180: "ECU Identification",
-            0xF181: "VIN",
-            0xF182: "Vehicle Manufacturer Name",
-            0xF183: "Vehicle Make",
-            0xF184: "Vehicle Model",
-            0xF185: "Vehicle Model Year",
-            0xF186: "Vehicle Trim Level",
-            0xF187: "ECU Hardware Number",
-            0xF188: "ECU Software Number",
-            0xF189: "ECU Manufacturing Date",
-            0xF18A: "ECU Serial Number",
-            0xF18B: "System Name",
-            0xF18C: "System Supplier",
-            
-            # 诊断信息
-            0xF190: "Active Diagnostic Session",
-            0xF191: "Boot Software Identification",
-            0xF192: "Application Software Identification",
-            0xF193: "Application Data Identification",
-            0xF194: "Bootloader Software Identification",
-            0xF195: "Calibration Identification",
-            0xF196: "Calibration Verification Numbers",
-            0xF197: "ECU Diagnostic Address",
-            0xF198: "ECU Name",
-            0xF199: "Programming Date",
-            
-            # 网络管理
-            0xF1A0: "CAN Network Configuration",
-            0xF1A1: "LIN Network Configuration",
-            0xF1A2: "FlexRay Network Configuration",
-            0xF1A3: "Ethernet Network Configuration",
-            
-            # 安全信息
-            0xF1B0: "Security Access Configuration",
-            0xF1B1: "Security Certificate",
-            0xF1B2: "Security Key",
-            
-            # 制造商特定范围
-            0xF200: "Manufacturer Specific 1",
-            0xF201: "Manufacturer Specific 2",
-            0xF202: "Manufacturer Specific 3",
-            0xF203: "Manufacturer Specific 4",
-            0xF204: "Manufacturer Specific 5",
-            0xF205: "Manufacturer Specific 6",
-        })
-        
-        return data_ids
+    return {data_id: sys.intern(name) for data_id, name in data_ids.items()}
+
+# 标准服务/数据标识符表只在导入时构建一次，所有实例共享只读视图
+_SERVICES: Mapping[int, UDSServiceDefinition] = MappingProxyType(_build_services())
+_DATA_IDENTIFIERS: Mapping[int, str] = MappingProxyType(_build_data_identifiers())
+_ALL_SERVICES: Tuple[UDSServiceDefinition, ...] = tuple(_SERVICES.values())
+
+def _build_subfunction_names(services: Mapping[int, UDSServiceDefinition]) -> Dict[Tuple[int, int], str]:
+    """构建 (服务ID, 子功能) -> 子功能名称 的扁平查找表"""
+    return {
+        (service_id, subfunction_id): name
+        for service_id, service_def in services.items()
+        if service_def.subfunctions
+        for subfunction_id, name in service_def.subfunctions.items()
+    }
+
+_SUBFUNCTION_NAMES: Mapping[Tuple[int, int], str] = MappingProxyType(_build_subfunction_names(_SERVICES))
+
+@functools.lru_cache(maxsize=256)
+def _format_unknown_data_identifier(data_id: int) -> str:
+    """格式化未知数据标识符名称（缓存重复出现的ID）"""
+    return f"Unknown (0x{data_id:04X})"
+
+class ProtocolDefinitions:
+    """协议定义管理器"""
     
+    def __init__(self):
+        # 默认引用共享的只读表，添加自定义项时才复制为实例私有字典
+        self.services: Mapping[int, UDSServiceDefinition] = _SERVICES
+        self.data_identifiers: Mapping[int, str] = _DATA_IDENTIFIERS
+        self._all_services_cache: Optional[Tuple[UDSServiceDefinition, ...]] = _ALL_SERVICES
+        self._subfunction_names: Mapping[Tuple[int, int], str] = _SUBFUNCTION_NAMES
+        
     def get_service_definition(self, service_id: int) -> Optional[UDSServiceDefinition]:
         """获取服务定义"""
         return self.services.get(service_id)
     
-    def get_all_services(self) -> List[UDSServiceDefinition]:
+    def get_subfunction_name(self, service_id: int, subfunction: int) -> Optional[str]:
+        """获取服务子功能名称"""
+        return self._subfunction_names.get((service_id, subfunction))
+    
+    def get_all_services(self) -> Sequence[UDSServiceDefinition]:
         """获取所有服务定义"""
-        return list(self.services.values())
+        services = self._all_services_cache
+        if services is None:
+            services = tuple(self.services.values())
+            self._all_services_cache = services
+        return services
     
     def get_data_identifier_name(self, data_id: int) -> str:
         """获取数据标识符名称"""
-        return self.data_identifiers.get(data_id, f"Unknown (0x{data_id:04X})")
+        name = self.data_identifiers.get(data_id)
+        return name if name is not None else _format_unknown_data_identifier(data_id)
+    
+    def has_data_identifier(self, data_id: int) -> bool:
+        """检查数据标识符是否已定义"""
+        return data_id in self.data_identifiers
     
     def add_custom_service(self, service_def: UDSServiceDefinition) -> bool:
         """添加自定义服务"""
         if service_def.service_id in self.services:
             return False
         
+        if self.services is _SERVICES:
+            self.services = dict(_SERVICES)
+        service_def = _intern_names(service_def)
         self.services[service_def.service_id] = service_def
+        self._all_services_cache = None
+        
+        if service_def.subfunctions:
+            if self._subfunction_names is _SUBFUNCTION_NAMES:
+                self._subfunction_names = dict(_SUBFUNCTION_NAMES)
+            self._subfunction_names.update(_build_subfunction_names({service_def.service_id: service_def}))
         return True
     
     def add_custom_data_identifier(self, data_id: int, name: str) -> bool:
@@ -549,5 +641,7 @@ class ProtocolDefinitions:
         if data_id in self.data_identifiers:
             return False
         
-        self.data_identifiers[data_id] = name
+        if self.data_identifiers is _DATA_IDENTIFIERS:
+            self.data_identifiers = dict(_DATA_IDENTIFIERS)
+        self.data_identifiers[data_id] = sys.intern(name)
         return True
\ No newline at end of file
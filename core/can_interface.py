@@ -6,12 +6,17 @@ CAN接口管理器 - 支持多种CAN卡接口
 支持CAN FD和标准CAN
 """
 
+import sys
+import select
+import socket
+import struct
 import logging
 import time
 import threading
-import queue
+from collections import deque, OrderedDict
 from enum import Enum
-from typing import Optional, Dict, List, Any, Tuple, Union
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, Tuple, Union, Callable, Mapping
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 
@@ -22,6 +27,12 @@ from can.message import Message
 from can.notifier import Notifier
 from can.interfaces import VALID_INTERFACES
 
+# 可选：fastrlock针对低竞争场景优化的可重入锁，未安装时使用标准库RLock
+try:
+    from fastrlock.rlock import FastRLock
+except ImportError:
+    from threading import RLock as FastRLock
+
 logger = logging.getLogger(__name__)
 
 class CANInterfaceStatus(Enum):
@@ -32,7 +43,13 @@ class CANInterfaceStatus(Enum):
     ERROR = "error"
     CLOSING = "closing"
 
-@dataclass
+# 字节到可打印ASCII的转换表，不可打印字节显示为'.'
+_ASCII_TABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+
+# Python 3.10+ 的数据类支持slots，旧版本退回普通数据类
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class CANFrame:
     """CAN帧数据类"""
     timestamp: float
@@ -46,6 +63,8 @@ class CANFrame:
     error_state_indicator: bool = False
     channel: int = 0
     dlc: int = 0
+    # data_hex的缓存（日志和监控界面会重复读取）
+    _hex_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.dlc == 0:
@@ -59,18 +78,127 @@ class CANFrame:
     @property
     def data_hex(self) -> str:
         """返回十六进制数据"""
-        return self.data.hex().upper()
+        data_hex = self._hex_cache
+        if data_hex is None:
+            data_hex = self.data.hex().upper()
+            self._hex_cache = data_hex
+        return data_hex
     
     @property
     def data_ascii(self) -> str:
         """返回ASCII数据"""
-        result = ""
-        for byte in self.data:
-            if 32 <= byte <= 126:
-                result += chr(byte)
-            else:
-                result += "."
-        return result
+        return self.data.translate(_ASCII_TABLE).decode('ascii')
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class InterfaceInfo:
+    """接口信息"""
+    interface_type: str
+    channel: str
+    status: str
+    is_connected: bool
+    config: Mapping[str, Any]  # 接口配置的只读实时视图
+    state: Optional[Any] = None
+    can_protocol: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        info = {
+            'interface_type': self.interface_type,
+            'channel': self.channel,
+            'status': self.status,
+            'is_connected': self.is_connected,
+            'config': dict(self.config),
+        }
+        if self.state is not None:
+            info['state'] = self.state
+        if self.can_protocol is not None:
+            info['can_protocol'] = self.can_protocol
+        return info
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class StatisticsSummary:
+    """CAN通信统计摘要"""
+    tx_frames: int
+    rx_frames: int
+    tx_bytes: int
+    rx_bytes: int
+    error_frames: int
+    uptime: float
+    tx_rate: float
+    rx_rate: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            'tx_frames': self.tx_frames,
+            'rx_frames': self.rx_frames,
+            'tx_bytes': self.tx_bytes,
+            'rx_bytes': self.rx_bytes,
+            'error_frames': self.error_frames,
+            'uptime': self.uptime,
+            'tx_rate': self.tx_rate,
+            'rx_rate': self.rx_rate,
+        }
+
+class _MessageFrame(CANFrame):
+    """
+    包装接收到的can.Message的只读CANFrame
+    
+    字段直接代理到原始消息，接收路径上不再逐个复制字段
+    """
+    __slots__ = ('_msg',)
+    
+    def __init__(self, msg: Message):
+        self._msg = msg
+        self._hex_cache = None
+    
+    @property
+    def timestamp(self) -> float:
+        return self._msg.timestamp
+    
+    @property
+    def arbitration_id(self) -> int:
+        return self._msg.arbitration_id
+    
+    @property
+    def data(self) -> bytes:
+        return self._msg.data
+    
+    @property
+    def is_extended_id(self) -> bool:
+        return self._msg.is_extended_id
+    
+    @property
+    def is_remote_frame(self) -> bool:
+        return self._msg.is_remote_frame
+    
+    @property
+    def is_error_frame(self) -> bool:
+        return self._msg.is_error_frame
+    
+    @property
+    def is_fd(self) -> bool:
+        return self._msg.is_fd
+    
+    @property
+    def bitrate_switch(self) -> bool:
+        return self._msg.bitrate_switch
+    
+    @property
+    def error_state_indicator(self) -> bool:
+        return self._msg.error_state_indicator
+    
+    @property
+    def channel(self) -> Any:
+        return self._msg.channel
+    
+    @property
+    def dlc(self) -> int:
+        return self._msg.dlc
+
+def _frame_from_message(msg: Message) -> CANFrame:
+    """将接收到的can.Message转换为CANFrame（零复制包装）"""
+    return _MessageFrame(msg)
 
 class CANStatistics:
     """CAN通信统计"""
@@ -80,7 +208,8 @@ class CANStatistics:
         self.tx_bytes = 0
         self.rx_bytes = 0
         self.error_frames = 0
-        self.start_time = time.time()
+        # 使用单调时钟计时，不受系统时间调整影响
+        self.start_time = time.monotonic()
     
     def reset(self):
         """重置统计"""
@@ -89,39 +218,219 @@ class CANStatistics:
         self.tx_bytes = 0
         self.rx_bytes = 0
         self.error_frames = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
     
     @property
     def uptime(self) -> float:
         """运行时间"""
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
     
     @property
     def tx_rate(self) -> float:
         """发送速率（帧/秒）"""
-        if self.uptime > 0:
-            return self.tx_frames / self.uptime
+        uptime = self.uptime
+        if uptime > 0:
+            return self.tx_frames / uptime
         return 0
     
     @property
     def rx_rate(self) -> float:
         """接收速率（帧/秒）"""
-        if self.uptime > 0:
-            return self.rx_frames / self.uptime
+        uptime = self.uptime
+        if uptime > 0:
+            return self.rx_frames / uptime
         return 0
     
-    def get_summary(self) -> Dict[str, Any]:
+    def get_summary(self) -> StatisticsSummary:
         """获取统计摘要"""
-        return {
-            'tx_frames': self.tx_frames,
-            'rx_frames': self.rx_frames,
-            'tx_bytes': self.tx_bytes,
-            'rx_bytes': self.rx_bytes,
-            'error_frames': self.error_frames,
-            'uptime': self.uptime,
-            'tx_rate': self.tx_rate,
-            'rx_rate': self.rx_rate,
-        }
+        # 只读取一次时钟，速率与运行时间基于同一时刻
+        uptime = self.uptime
+        tx_frames = self.tx_frames
+        rx_frames = self.rx_frames
+        return StatisticsSummary(
+            tx_frames,
+            rx_frames,
+            self.tx_bytes,
+            self.rx_bytes,
+            self.error_frames,
+            uptime,
+            tx_frames / uptime if uptime > 0 else 0,
+            rx_frames / uptime if uptime > 0 else 0,
+        )
+
+# 每个发送线程缓存的can.Message模板数量上限
+TX_TEMPLATE_CACHE_SIZE = 256
+
+# SocketCAN经典CAN帧的内核结构 struct can_frame: can_id(u32) len(u8) 3字节填充 data[8]
+_SOCKETCAN_FRAME = struct.Struct('=IB3x8s')
+CAN_EFF_FLAG = 0x80000000
+
+# SocketCAN套接字的默认接收缓冲区大小（字节，实际上限受net.core.rmem_max限制）
+SOCKETCAN_RX_BUFFER_SIZE = 1 << 20
+
+# 可用接口探测结果缓存 (探测时间, 接口列表) 及其有效期（秒）
+AVAILABLE_INTERFACES_TTL = 30.0
+_available_interfaces_cache: Optional[Tuple[float, List[Dict[str, str]]]] = None
+_available_interfaces_lock = threading.Lock()
+
+# 接收批处理参数：累积到批大小或等待超过间隔后统一分发
+RX_BATCH_SIZE = 32
+RX_BATCH_INTERVAL = 0.001  # 秒
+
+class BatchedFrameListener(can.Listener):
+    """
+    批量接收监听器
+    
+    将通知器逐帧送来的消息累积成批，达到批大小或超过批间隔后
+    一次性交给接口处理，摊薄逐帧的统计和回调开销
+    """
+    
+    def __init__(self, handler: Callable[[List[Message]], None],
+                 batch_size: int = RX_BATCH_SIZE, interval: float = RX_BATCH_INTERVAL):
+        """
+        初始化批量监听器
+        
+        Args:
+            handler: 批处理函数，接收一个消息列表
+            batch_size: 批大小
+            interval: 批间隔（秒）
+        """
+        self._handler = handler
+        self._batch_size = batch_size
+        self._interval = interval
+        self._batch: List[Message] = []
+        # 同一把锁保护缓冲区和分发，保证批次按到达顺序交付
+        self._lock = threading.Lock()
+        self._pending = threading.Event()
+        self._running = True
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+    
+    def on_message_received(self, msg: Message) -> None:
+        """通知器回调：缓存消息，批满时立即分发"""
+        if msg is None:
+            return
+        
+        with self._lock:
+            batch = self._batch
+            batch.append(msg)
+            if len(batch) < self._batch_size:
+                if len(batch) == 1:
+                    self._pending.set()
+                return
+            
+            self._batch = []
+            self._dispatch(batch)
+    
+    def flush(self) -> None:
+        """分发缓存中的消息"""
+        with self._lock:
+            batch = self._batch
+            if not batch:
+                return
+            
+            self._batch = []
+            self._dispatch(batch)
+    
+    def stop(self) -> None:
+        """停止监听器并分发剩余消息"""
+        self._running = False
+        self._pending.set()
+        if self._flush_thread.is_alive() and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=1.0)
+        self.flush()
+    
+    def _dispatch(self, batch: List[Message]) -> None:
+        try:
+            self._handler(batch)
+        except Exception as e:
+            logger.error(f"Error processing received messages: {e}")
+    
+    def _flush_loop(self) -> None:
+        """批间隔到期后分发未满的批次"""
+        while self._running:
+            if not self._pending.wait(timeout=0.1):
+                continue
+            
+            self._pending.clear()
+            time.sleep(self._interval)
+            self.flush()
+
+# select批量读取时单次唤醒最多读取的帧数，避免长时间占用读取线程
+RX_DRAIN_LIMIT = 256
+
+class SelectBatchReader:
+    """
+    基于select的批量读取器
+    
+    用于提供原始套接字的总线（如SocketCAN）：一次select唤醒后
+    以非阻塞方式读空所有就绪的帧，再整批交给接口处理，替代can.Notifier
+    """
+    
+    def __init__(self, bus: Bus, handler: Callable[[List[Message]], None], timeout: float = 0.1,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        初始化批量读取器
+        
+        Args:
+            bus: CAN总线（需要有socket属性）
+            handler: 批处理函数，接收一个消息列表
+            timeout: select超时时间（秒），决定停止时的响应延迟
+            on_error: 读取出错时的回调，读取线程随后退出
+        """
+        self._bus = bus
+        self._handler = handler
+        self._timeout = timeout
+        self._on_error = on_error
+        self._fileno = bus.socket.fileno()
+        self._running = True
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 1.0) -> None:
+        """停止读取线程"""
+        self._running = False
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+    
+    def _read_loop(self) -> None:
+        bus = self._bus
+        fileno = self._fileno
+        
+        while self._running:
+            try:
+                ready, _, _ = select.select([fileno], [], [], self._timeout)
+            except (OSError, ValueError):
+                # 套接字已关闭
+                break
+            
+            if not ready:
+                continue
+            
+            batch = []
+            while len(batch) < RX_DRAIN_LIMIT:
+                try:
+                    msg = bus.recv(timeout=0.0)
+                except Exception as e:
+                    # 与can.Notifier一致：读取出错后停止线程，避免select持续就绪导致空转
+                    logger.error(f"Error reading from CAN bus: {e}")
+                    self._running = False
+                    if self._on_error is not None:
+                        try:
+                            self._on_error(e)
+                        except Exception as callback_error:
+                            logger.error(f"Error in CAN reader error callback: {callback_error}")
+                    break
+                
+                if msg is None:
+                    break
+                batch.append(msg)
+            
+            if batch:
+                try:
+                    self._handler(batch)
+                except Exception as e:
+                    logger.error(f"Error processing received messages: {e}")
 
 class BaseCANInterface(ABC):
     """CAN接口基类"""
@@ -138,12 +447,25 @@ class BaseCANInterface(ABC):
         self.interface_type = interface_type
         self.channel = channel
         self._bus: Optional[Bus] = None
-        self._notifier: Optional[Notifier] = None
+        self._notifier: Optional[Union[Notifier, SelectBatchReader]] = None
         self._status = CANInterfaceStatus.DISCONNECTED
-        self._receive_queue = queue.Queue(maxsize=10000)
-        self._callbacks = []
+        # 接收缓冲区：deque的append/popleft在CPython中是原子操作，
+        # 满时自动丢弃最旧的帧；仅当有消费者等待时才通过事件唤醒
+        self._receive_queue = deque(maxlen=10000)
+        self._rx_event = threading.Event()
+        self._rx_waiting = False
+        # 是否有消费者通过receive_frame读取队列（首次调用时置位，断开时清除）
+        self._consumer_active = False
+        # 回调以dict作有序集合：成员检查O(1)，修改时整体替换（写时复制），
+        # 接收线程遍历的始终是一个不会再变化的字典
+        self._callbacks: Dict[Callable, None] = {}
+        self._batch_callbacks: Dict[Callable, None] = {}
         self._statistics = CANStatistics()
-        self._lock = threading.RLock()
+        # 按帧格式缓存的发送消息模板（线程私有，发送路径无锁也不会互相覆盖）
+        self._tx_templates = threading.local()
+        
+        # 生命周期锁（连接/断开），发送路径不加锁
+        self._lock = FastRLock()
         
         # 配置参数
         self.config = kwargs
@@ -178,6 +500,10 @@ class BaseCANInterface(ABC):
                 logger.warning("CAN interface already connected")
                 return True
             
+            # 之前的连接出错后总线可能仍未关闭（如读取线程出错退出），先释放再重连
+            if self._bus is not None or self._notifier is not None:
+                self.disconnect()
+            
             self._status = CANInterfaceStatus.CONNECTING
             logger.info(f"Connecting to {self.interface_type} on channel {self.channel}")
             
@@ -188,8 +514,8 @@ class BaseCANInterface(ABC):
                 # 创建CAN总线
                 self._bus = self._create_bus()
                 
-                # 创建通知器
-                self._notifier = can.Notifier(self._bus, [self._on_message_received])
+                # 启动接收
+                self._notifier = self._start_receiving()
                 
                 self._status = CANInterfaceStatus.CONNECTED
                 self._statistics.reset()
@@ -210,7 +536,9 @@ class BaseCANInterface(ABC):
             bool: 断开是否成功
         """
         with self._lock:
-            if not self.is_connected and self._status != CANInterfaceStatus.CONNECTING:
+            # 错误状态下总线和读取线程可能仍在，需要继续释放
+            if not self.is_connected and self._status not in (CANInterfaceStatus.CONNECTING,
+                                                              CANInterfaceStatus.ERROR):
                 return True
             
             self._status = CANInterfaceStatus.CLOSING
@@ -227,12 +555,11 @@ class BaseCANInterface(ABC):
                     self._bus.shutdown()
                     self._bus = None
                 
-                # 清空接收队列
-                while not self._receive_queue.empty():
-                    try:
-                        self._receive_queue.get_nowait()
-                    except queue.Empty:
-                        break
+                # 清空接收队列（单次C层操作），并唤醒正在等待的接收者
+                self._receive_queue.clear()
+                self._consumer_active = False
+                if self._rx_waiting:
+                    self._rx_event.set()
                 
                 self._status = CANInterfaceStatus.DISCONNECTED
                 logger.info(f"Successfully disconnected from {self.interface_type}")
@@ -248,6 +575,15 @@ class BaseCANInterface(ABC):
         """创建CAN总线"""
         pass
     
+    def _start_receiving(self) -> Union[Notifier, SelectBatchReader]:
+        """
+        启动接收
+        
+        Returns:
+            接收器，断开连接时调用其stop()方法
+        """
+        return can.Notifier(self._bus, [BatchedFrameListener(self._on_messages_received)])
+    
     def send_frame(self, frame: CANFrame) -> bool:
         """
         发送CAN帧
@@ -258,39 +594,75 @@ class BaseCANInterface(ABC):
         Returns:
             bool: 发送是否成功
         """
-        with self._lock:
-            if not self.is_connected or not self._bus:
-                logger.error("CAN interface not connected")
-                return False
+        # 总线引用在断开时整体替换，先取快照再检查，无需加锁
+        bus = self._bus
+        if bus is None or self._status is not CANInterfaceStatus.CONNECTED:
+            logger.error("CAN interface not connected")
+            return False
+        
+        try:
+            # 获取（或创建）该帧格式的can.Message模板，只替换数据
+            msg = self._get_tx_message(frame)
             
-            try:
-                # 创建can.Message对象
-                msg = Message(
-                    arbitration_id=frame.arbitration_id,
-                    data=frame.data,
-                    is_extended_id=frame.is_extended_id,
-                    is_remote_frame=frame.is_remote_frame,
-                    is_error_frame=frame.is_error_frame,
-                    is_fd=frame.is_fd,
-                    bitrate_switch=frame.bitrate_switch,
-                    error_state_indicator=frame.error_state_indicator,
-                    channel=frame.channel,
-                    dlc=frame.dlc
-                )
-                
-                # 发送消息
-                self._bus.send(msg, timeout=0.1)
-                
-                # 更新统计
-                self._statistics.tx_frames += 1
-                self._statistics.tx_bytes += len(frame.data)
-                
-                logger.debug(f"Sent CAN frame: ID={frame.id_hex}, Data={frame.data_hex}")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Failed to send CAN frame: {e}")
-                return False
+            # python-can总线的send本身是线程安全的，这里不再加锁
+            bus.send(msg, timeout=0.1)
+            
+            # 更新统计（并发发送时计数可能有极少量误差，统计用途可以接受）
+            self._statistics.tx_frames += 1
+            self._statistics.tx_bytes += len(frame.data)
+            
+            logger.debug(f"Sent CAN frame: ID={frame.id_hex}, Data={frame.data_hex}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to send CAN frame: {e}")
+            return False
+    
+    def _get_tx_message(self, frame: CANFrame) -> Message:
+        """
+        获取发送用的can.Message
+        
+        同一ID和标志组合的帧重复发送时复用缓存的消息对象，只更新数据和DLC
+        
+        Args:
+            frame: CAN帧
+            
+        Returns:
+            Message: 待发送的消息
+        """
+        cache = getattr(self._tx_templates, 'messages', None)
+        if cache is None:
+            cache = OrderedDict()
+            self._tx_templates.messages = cache
+        
+        key = (frame.arbitration_id, frame.is_extended_id, frame.is_remote_frame,
+               frame.is_error_frame, frame.is_fd, frame.bitrate_switch,
+               frame.error_state_indicator, frame.channel)
+        msg = cache.get(key)
+        
+        if msg is None:
+            msg = Message(
+                arbitration_id=frame.arbitration_id,
+                data=frame.data,
+                is_extended_id=frame.is_extended_id,
+                is_remote_frame=frame.is_remote_frame,
+                is_error_frame=frame.is_error_frame,
+                is_fd=frame.is_fd,
+                bitrate_switch=frame.bitrate_switch,
+                error_state_indicator=frame.error_state_indicator,
+                channel=frame.channel,
+                dlc=frame.dlc
+            )
+            cache[key] = msg
+            if len(cache) > TX_TEMPLATE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+            msg.data = bytearray(frame.data)
+            msg.dlc = frame.dlc
+            msg.timestamp = 0.0
+        
+        return msg
     
     def receive_frame(self, timeout: float = 0.1) -> Optional[CANFrame]:
         """
@@ -302,11 +674,31 @@ class BaseCANInterface(ABC):
         Returns:
             CANFrame or None: 接收到的帧，超时返回None
         """
+        self._consumer_active = True
+        receive_queue = self._receive_queue
         try:
-            msg = self._receive_queue.get(timeout=timeout)
-            return msg
-        except queue.Empty:
-            return None
+            return receive_queue.popleft()
+        except IndexError:
+            pass
+        
+        # 先登记等待并清除事件，再检查一次队列，避免错过期间到达的帧
+        self._rx_waiting = True
+        self._rx_event.clear()
+        try:
+            try:
+                return receive_queue.popleft()
+            except IndexError:
+                pass
+            
+            if not self._rx_event.wait(timeout):
+                return None
+            
+            try:
+                return receive_queue.popleft()
+            except IndexError:
+                return None
+        finally:
+            self._rx_waiting = False
     
     def _on_message_received(self, msg: Message) -> None:
         """
@@ -318,43 +710,48 @@ class BaseCANInterface(ABC):
         if not msg:
             return
         
+        self._on_messages_received([msg])
+    
+    def _on_messages_received(self, msgs: List[Message]) -> None:
+        """
+        批量处理接收到的CAN消息
+        
+        Args:
+            msgs: CAN消息列表
+        """
         try:
+            # 没有回调也没有队列消费者时，只更新统计，不构建CANFrame
+            if not self._callbacks and not self._batch_callbacks and not self._consumer_active:
+                self._statistics.rx_frames += len(msgs)
+                self._statistics.rx_bytes += sum(len(msg.data) for msg in msgs)
+                return
+            
             # 创建CANFrame对象
-            frame = CANFrame(
-                timestamp=msg.timestamp,
-                arbitration_id=msg.arbitration_id,
-                data=msg.data,
-                is_extended_id=msg.is_extended_id,
-                is_remote_frame=msg.is_remote_frame,
-                is_error_frame=msg.is_error_frame,
-                is_fd=msg.is_fd,
-                bitrate_switch=msg.bitrate_switch,
-                error_state_indicator=msg.error_state_indicator,
-                channel=msg.channel,
-                dlc=msg.dlc
-            )
+            frames = [_frame_from_message(msg) for msg in msgs]
             
-            # 添加到接收队列
-            try:
-                self._receive_queue.put_nowait(frame)
-            except queue.Full:
-                # 队列已满，丢弃最旧的消息
-                try:
-                    self._receive_queue.get_nowait()
-                    self._receive_queue.put_nowait(frame)
-                except queue.Empty:
-                    pass
+            # 添加到接收队列（队列已满时deque自动丢弃最旧的消息）
+            self._receive_queue.extend(frames)
+            if self._rx_waiting:
+                self._rx_event.set()
             
-            # 更新统计
-            self._statistics.rx_frames += 1
-            self._statistics.rx_bytes += len(msg.data)
+            # 更新统计（每批一次）
+            self._statistics.rx_frames += len(frames)
+            self._statistics.rx_bytes += sum(len(frame.data) for frame in frames)
             
-            # 调用注册的回调函数
-            for callback in self._callbacks:
+            # 调用注册的批量回调函数
+            for callback in self._batch_callbacks:
                 try:
-                    callback(frame)
+                    callback(frames)
                 except Exception as e:
-                    logger.error(f"Error in CAN frame callback: {e}")
+                    logger.error(f"Error in CAN batch callback: {e}")
+            
+            # 调用注册的回调函数
+            for callback in self._callbacks:
+                for frame in frames:
+                    try:
+                        callback(frame)
+                    except Exception as e:
+                        logger.error(f"Error in CAN frame callback: {e}")
                     
         except Exception as e:
             logger.error(f"Error processing received message: {e}")
@@ -367,7 +764,9 @@ class BaseCANInterface(ABC):
             callback: 回调函数，接收一个CANFrame参数
         """
         if callback not in self._callbacks:
-            self._callbacks.append(callback)
+            callbacks = dict(self._callbacks)
+            callbacks[callback] = None
+            self._callbacks = callbacks
     
     def remove_callback(self, callback: callable) -> None:
         """
@@ -377,34 +776,63 @@ class BaseCANInterface(ABC):
             callback: 回调函数
         """
         if callback in self._callbacks:
-            self._callbacks.remove(callback)
+            callbacks = dict(self._callbacks)
+            del callbacks[callback]
+            self._callbacks = callbacks
+    
+    def add_batch_callback(self, callback: callable) -> None:
+        """
+        添加批量接收回调函数
+        
+        Args:
+            callback: 回调函数，接收一个CANFrame列表参数
+        """
+        if callback not in self._batch_callbacks:
+            callbacks = dict(self._batch_callbacks)
+            callbacks[callback] = None
+            self._batch_callbacks = callbacks
+    
+    def remove_batch_callback(self, callback: callable) -> None:
+        """
+        移除批量接收回调函数
+        
+        Args:
+            callback: 回调函数
+        """
+        if callback in self._batch_callbacks:
+            callbacks = dict(self._batch_callbacks)
+            del callbacks[callback]
+            self._batch_callbacks = callbacks
     
     def clear_callbacks(self) -> None:
         """清空所有回调函数"""
-        self._callbacks.clear()
+        self._callbacks = {}
+        self._batch_callbacks = {}
     
-    def get_info(self) -> Dict[str, Any]:
+    def get_info(self) -> InterfaceInfo:
         """
         获取接口信息
         
         Returns:
-            dict: 接口信息
+            InterfaceInfo: 接口信息（config为配置的只读实时视图，需要字典时调用to_dict()）
         """
-        info = {
-            'interface_type': self.interface_type,
-            'channel': self.channel,
-            'status': self.status.value,
-            'is_connected': self.is_connected,
-            'config': self.config.copy(),
-        }
-        
-        if self._bus:
-            info.update({
-                'state': self._bus.state,
-                'can_protocol': str(self._bus.protocol),
-            })
-        
-        return info
+        bus = self._bus
+        if bus is not None:
+            state = bus.state
+            can_protocol = str(bus.protocol)
+        else:
+            state = None
+            can_protocol = None
+        
+        return InterfaceInfo(
+            self.interface_type,
+            self.channel,
+            self.status.value,
+            self.is_connected,
+            MappingProxyType(self.config),
+            state,
+            can_protocol,
+        )
 
 class PCANInterface(BaseCANInterface):
     """PCAN接口实现"""
@@ -687,7 +1115,7 @@ class SocketCANInterface(BaseCANInterface):
     
     def _create_bus(self) -> Bus:
         """创建SocketCAN总线"""
-        return can.Bus(
+        bus = can.Bus(
             interface='socketcan',
             channel=self.channel,
             bitrate=self.config.get('bitrate', 500000),
@@ -695,6 +1123,77 @@ class SocketCANInterface(BaseCANInterface):
             data_bitrate=self.config.get('data_bitrate', 2000000),
             **self._get_interface_params()
         )
+        self._tune_socket(bus)
+        return bus
+    
+    def _start_receiving(self) -> Union[Notifier, SelectBatchReader]:
+        """有原始套接字时使用select批量读取，否则退回can.Notifier"""
+        if getattr(self._bus, 'socket', None) is None:
+            return super()._start_receiving()
+        
+        return SelectBatchReader(self._bus, self._on_messages_received, on_error=self._on_reader_error)
+    
+    def _on_reader_error(self, error: Exception) -> None:
+        """读取线程因错误退出时，将接口标记为错误状态"""
+        self._status = CANInterfaceStatus.ERROR
+    
+    def _tune_socket(self, bus: Bus) -> None:
+        """
+        调整原始CAN套接字的接收缓冲区
+        
+        较大的内核缓冲区让突发帧在内核中排队，由接收线程一次唤醒后批量读取，
+        而不是在用户态处理不及时被丢弃
+        """
+        sock = getattr(bus, 'socket', None)
+        if sock is None:
+            return
+        
+        rx_buffer_size = int(self.config.get('rx_buffer_size', SOCKETCAN_RX_BUFFER_SIZE))
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rx_buffer_size)
+        except OSError as e:
+            logger.warning(f"Failed to set SocketCAN receive buffer size: {e}")
+    
+    def send_frame(self, frame: CANFrame) -> bool:
+        """
+        发送CAN帧
+        
+        经典CAN数据帧直接按内核帧格式打包写入套接字，不构建can.Message；
+        CAN FD、远程帧和错误帧仍走python-can的发送路径
+        
+        Args:
+            frame: CAN帧
+            
+        Returns:
+            bool: 发送是否成功
+        """
+        data = frame.data
+        if frame.is_fd or frame.is_remote_frame or frame.is_error_frame or len(data) > 8:
+            return super().send_frame(frame)
+        
+        bus = self._bus
+        sock = getattr(bus, 'socket', None)
+        if sock is None or self._status is not CANInterfaceStatus.CONNECTED:
+            return super().send_frame(frame)
+        
+        can_id = frame.arbitration_id
+        if frame.is_extended_id:
+            can_id |= CAN_EFF_FLAG
+        
+        try:
+            # 帧长度取数据实际长度（与python-can的数据帧打包一致，dlc字段只用于远程帧）；
+            # '8s'格式会自动用0补齐不足8字节的数据
+            sock.send(_SOCKETCAN_FRAME.pack(can_id, len(data), bytes(data)))
+        except Exception as e:
+            logger.error(f"Failed to send CAN frame: {e}")
+            return False
+        
+        # 更新统计
+        self._statistics.tx_frames += 1
+        self._statistics.tx_bytes += len(data)
+        
+        logger.debug(f"Sent CAN frame: ID={frame.id_hex}, Data={frame.data_hex}")
+        return True
     
     def _get_interface_params(self) -> Dict[str, Any]:
         """获取SocketCAN接口参数"""
@@ -712,6 +1211,20 @@ class SocketCANInterface(BaseCANInterface):
 class CANInterfaceFactory:
     """CAN接口工厂"""
     
+    # 接口类型映射（类定义时构建一次，键经过驻留）
+    _INTERFACE_CLASSES: Dict[str, type] = {sys.intern(name): cls for name, cls in {
+        'pcan': PCANInterface,
+        'vector': VectorInterface,
+        'ixxat': IXXATInterface,
+        'kvaser': KvaserInterface,
+        'slcan': SLCANInterface,
+        'candlelight': CandleLightInterface,
+        'ni_xnet': NIXNETInterface,
+        'nixnet': NIXNETInterface,
+        'virtual': VirtualInterface,
+        'socketcan': SocketCANInterface,
+    }.items()}
+    
     @staticmethod
     def create_interface(interface_type: str, **kwargs) -> BaseCANInterface:
         """
@@ -724,78 +1237,79 @@ class CANInterfaceFactory:
         Returns:
             BaseCANInterface: CAN接口实例
         """
-        interface_type = interface_type.lower()
-        
-        # 接口类型映射
-        interface_classes = {
-            'pcan': PCANInterface,
-            'vector': VectorInterface,
-            'ixxat': IXXATInterface,
-            'kvaser': KvaserInterface,
-            'slcan': SLCANInterface,
-            'candlelight': CandleLightInterface,
-            'ni_xnet': NIXNETInterface,
-            'nixnet': NIXNETInterface,
-            'virtual': VirtualInterface,
-            'socketcan': SocketCANInterface,
-        }
+        interface_type = sys.intern(interface_type.lower())
         
-        if interface_type not in interface_classes:
+        interface_class = CANInterfaceFactory._INTERFACE_CLASSES.get(interface_type)
+        if interface_class is None:
             logger.warning(f"Interface type '{interface_type}' not supported, using virtual")
             interface_type = 'virtual'
+            interface_class = VirtualInterface
         
         # 创建接口实例
-        interface_class = interface_classes[interface_type]
         return interface_class(interface_type, **kwargs)
     
     @staticmethod
-    def get_available_interfaces() -> List[Dict[str, str]]:
+    def get_available_interfaces(force_refresh: bool = False) -> List[Dict[str, str]]:
         """
         获取可用接口列表
         
+        探测驱动开销较大，结果在AVAILABLE_INTERFACES_TTL内复用
+        
+        Args:
+            force_refresh: 是否忽略缓存重新探测
+        
         Returns:
             list: 可用接口信息列表
         """
-        interfaces = []
-        
-        try:
-            # 使用python-can检测可用接口
-            available_configs = can.detect_available_configs()
-            
-            for config in available_configs:
-                interface_info = {
-                    'interface': config['interface'],
-                    'channel': str(config.get('channel', '0')),
-                    'description': f"{config['interface']} - {config.get('channel', '0')}",
-                }
-                
-                # 添加额外信息
-                if 'serial' in config:
-                    interface_info['serial'] = config['serial']
-                
-                interfaces.append(interface_info)
-                
-        except Exception as e:
-            logger.error(f"Error detecting interfaces: {e}")
-        
-        # 如果没有检测到接口，添加虚拟接口
-        if not interfaces:
-            interfaces = [
-                {
-                    'interface': 'virtual',
-                    'channel': '0',
-                    'description': 'Virtual CAN Interface',
-                }
-            ]
+        global _available_interfaces_cache
         
-        return interfaces
+        with _available_interfaces_lock:
+            cache = _available_interfaces_cache
+            if (not force_refresh and cache is not None
+                    and time.monotonic() - cache[0] < AVAILABLE_INTERFACES_TTL):
+                return [dict(info) for info in cache[1]]
+            
+            interfaces = []
+            
+            try:
+                # 使用python-can检测可用接口
+                available_configs = can.detect_available_configs()
+            
+                for config in available_configs:
+                    interface_info = {
+                        'interface': config['interface'],
+                        'channel': str(config.get('channel', '0')),
+                        'description': f"{config['interface']} - {config.get('channel', '0')}",
+                    }
+            
+                    # 添加额外信息
+                    if 'serial' in config:
+                        interface_info['serial'] = config['serial']
+            
+                    interfaces.append(interface_info)
+            
+            except Exception as e:
+                logger.error(f"Error detecting interfaces: {e}")
+            
+            # 如果没有检测到接口，添加虚拟接口
+            if not interfaces:
+                interfaces = [
+                    {
+                        'interface': 'virtual',
+                        'channel': '0',
+                        'description': 'Virtual CAN Interface',
+                    }
+                ]
+            
+            _available_interfaces_cache = (time.monotonic(), interfaces)
+            return [dict(info) for info in interfaces]
 
 class CANInterfaceManager:
     """CAN接口管理器"""
     
     def __init__(self):
         self._interfaces: Dict[str, BaseCANInterface] = {}
-        self._lock = threading.RLock()
+        self._lock = FastRLock()
     
     def create_interface(self, interface_id: str, interface_type: str, **kwargs) -> BaseCANInterface:
         """
@@ -830,8 +1344,9 @@ class CANInterfaceManager:
         Returns:
             BaseCANInterface or None: 接口实例
         """
-        with self._lock:
-            return self._interfaces.get(interface_id)
+        # dict.get在GIL下是原子的，只有增删接口需要加锁；
+        # 与remove_interface并发时返回None，调用方已处理该情况
+        return self._interfaces.get(interface_id)
     
     def remove_interface(self, interface_id: str) -> bool:
         """
@@ -916,17 +1431,41 @@ class CANInterfaceManager:
         
         return interface.send_frame(frame)
     
-    def get_all_interfaces(self) -> Dict[str, BaseCANInterface]:
+    def send_frames(self, interface_id: str, frames: List[CANFrame]) -> List[bool]:
+        """
+        批量发送CAN帧
+        
+        接口只查找和检查一次，适合同一时刻到期的多个周期帧
+        
+        Args:
+            interface_id: 接口ID
+            frames: CAN帧列表
+            
+        Returns:
+            List[bool]: 每帧是否发送成功
+        """
+        interface = self.get_interface(interface_id)
+        if not interface:
+            logger.error(f"Interface '{interface_id}' not found")
+            return [False] * len(frames)
+        
+        if not interface.is_connected:
+            logger.error(f"Interface '{interface_id}' not connected")
+            return [False] * len(frames)
+        
+        send = interface.send_frame
+        return [send(frame) for frame in frames]
+    
+    def get_all_interfaces(self) -> Mapping[str, BaseCANInterface]:
         """
         获取所有接口
         
         Returns:
-            dict: 所有接口
+            Mapping: 所有接口的只读实时视图，需要在遍历期间增删接口时请先复制
         """
-        with self._lock:
-            return self._interfaces.copy()
+        return MappingProxyType(self._interfaces)
     
-    def get_interface_info(self, interface_id: str) -> Optional[Dict[str, Any]]:
+    def get_interface_info(self, interface_id: str) -> Optional[InterfaceInfo]:
         """
         获取接口信息
         
@@ -934,7 +1473,7 @@ class CANInterfaceManager:
             interface_id: 接口ID
             
         Returns:
-            dict or None: 接口信息
+            InterfaceInfo or None: 接口信息
         """
         interface = self.get_interface(interface_id)
         if not interface:
@@ -5,17 +5,29 @@
 支持CAN帧、UDS帧的发送，支持周期性发送和单次发送
 """
 
+import io
+import sys
 import logging
 import time
 import threading
+import heapq
+import itertools
 import json
 import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from enum import Enum
-from typing import Optional, Dict, List, Any, Tuple, Union, Callable
-from dataclasses import dataclass, field, asdict
-from dataclasses_json import dataclass_json
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, Set, Tuple, Union, Callable, Mapping, BinaryIO, Sequence, Iterator, Iterable
+from dataclasses import dataclass, field, fields
 import copy
 
+# 优先使用orjson进行工程文件的读写
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .can_interface import CANFrame, CANInterfaceManager
 from .uds_session_manager import UDSSessionManager, UDSRequest, UDSResponse
 from .isotp_protocol import ISOTPConfig
@@ -23,6 +35,100 @@ from config.protocol_definitions import ProtocolDefinitions, UDSServiceDefinitio
 
 logger = logging.getLogger(__name__)
 
+# Python 3.10+ 的数据类支持slots，旧版本退回普通数据类
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# 周期发送统计写回命令对象的间隔（秒）
+PERIODIC_STATS_FLUSH_INTERVAL = 0.1
+
+# 写JSON文件时的缓冲区大小（字节）
+JSON_WRITE_BUFFER_SIZE = 64 * 1024
+
+# 管理器中(工程ID, 组ID)解析缓存的最大条目数
+GROUP_CACHE_SIZE = 256
+
+# 周期帧合批窗口（秒），在此时间内到期的帧合并为一批发送
+PERIODIC_BATCH_WINDOW = 0.001
+
+# 加载时共享的数据负载池最大条目数，超出后新负载不再入池
+PAYLOAD_POOL_SIZE = 4096
+
+# 组内连续删除多少条命令后整体重建位置索引（期间按位置附近回查定位）
+COMMAND_POSITION_REBUILD_THRESHOLD = 64
+
+# 十六进制字符串中需要剔除的空白字符
+_HEX_STRIP_TABLE = str.maketrans('', '', ' \t\r\n')
+
+# 加载的数据负载池，相同负载的命令共享同一个bytes对象
+_PAYLOAD_POOL: Dict[bytes, bytes] = {}
+
+def _intern_str(value: Any) -> Any:
+    """驻留字符串，使大量命令中重复的名称和注释共享同一对象"""
+    return sys.intern(value) if type(value) is str else value
+
+def _payload_to_bytes(payload: Any) -> bytes:
+    """将工程文件中的数据字段转换为bytes（十六进制字符串或整数列表）"""
+    if isinstance(payload, str):
+        data = _hex_to_bytes(payload)
+    else:
+        data = bytes(payload)
+    
+    pooled = _PAYLOAD_POOL.get(data)
+    if pooled is not None:
+        return pooled
+    if len(_PAYLOAD_POOL) < PAYLOAD_POOL_SIZE:
+        _PAYLOAD_POOL[data] = data
+    return data
+
+def _normalize_payloads(command: 'Command') -> None:
+    """将直接构造的命令中非bytes的数据字段（十六进制字符串等）一次性转换为bytes，发送时无需再解析"""
+    can_frame = command.can_frame
+    if can_frame is not None and type(can_frame.data) is not bytes:
+        can_frame.data = _payload_to_bytes(can_frame.data)
+    uds_command = command.uds_command
+    if uds_command is not None and type(uds_command.data) is not bytes:
+        uds_command.data = _payload_to_bytes(uds_command.data)
+
+def _hex_to_bytes(hex_str: str) -> bytes:
+    """十六进制字符串转bytes"""
+    try:
+        # bytes.fromhex本身接受字节之间的空白，常见格式一次C调用即可完成
+        return bytes.fromhex(hex_str)
+    except ValueError:
+        # 空白出现在字节内部等情况，剔除全部空白后重试
+        return bytes.fromhex(hex_str.translate(_HEX_STRIP_TABLE))
+
+def _dump_json(data: Any) -> bytes:
+    """将工程数据序列化为UTF-8编码的JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _stream_json(data: Any, fp: BinaryIO) -> None:
+    """将数据增量编码为UTF-8 JSON并逐块写入二进制流，不生成完整的JSON字符串"""
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    write = fp.write
+    for chunk in encoder.iterencode(data):
+        write(chunk.encode('utf-8'))
+
+def _write_json(data: Any, fp: BinaryIO) -> None:
+    """将数据以JSON写入二进制流（有orjson时一次性序列化，否则流式写入）"""
+    if orjson is not None:
+        fp.write(_dump_json(data))
+    else:
+        _stream_json(data, fp)
+
+def _write_json_file(data: Any, file_path: str) -> None:
+    """经缓冲写入器将数据写入JSON文件"""
+    with io.BufferedWriter(io.FileIO(file_path, 'w'), buffer_size=JSON_WRITE_BUFFER_SIZE) as f:
+        _write_json(data, f)
+
+def _load_json(raw: bytes) -> Any:
+    """解析UTF-8编码的JSON"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class CommandType(Enum):
     """命令类型"""
     CAN_FRAME = "can_frame"
@@ -45,8 +151,28 @@ class CommandStatus(Enum):
     FAILED = "failed"       # 执行失败
     STOPPED = "stopped"     # 已停止
 
-@dataclass_json
-@dataclass
+# 命令相关枚举成员到值的映射，序列化时省去.value属性访问
+_ENUM_VALUES: Dict[Enum, str] = {
+    member: member.value
+    for enum_cls in (CommandType, SendMode, CommandStatus)
+    for member in enum_cls
+}
+
+# 枚举值到成员的直接映射，反序列化时跳过Enum.__call__的查找流程
+_COMMAND_TYPE_BY_VALUE: Dict[str, CommandType] = {m.value: m for m in CommandType}
+_SEND_MODE_BY_VALUE: Dict[str, SendMode] = {m.value: m for m in SendMode}
+_COMMAND_STATUS_BY_VALUE: Dict[str, CommandStatus] = {m.value: m for m in CommandStatus}
+
+# 模板中常用的枚举值
+_CMD_TYPE_CAN_FRAME = CommandType.CAN_FRAME.value
+_CMD_TYPE_UDS = CommandType.UDS_COMMAND.value
+_SEND_MODE_SINGLE = SendMode.SINGLE.value
+
+# 合法的命令类型和发送方式，命令加入组时据此校验
+_COMMAND_TYPE_SET = frozenset(CommandType)
+_SEND_MODE_SET = frozenset(SendMode)
+
+@dataclass(**_DATACLASS_SLOTS)
 class CANFrameCommand:
     """CAN帧命令"""
     arbitration_id: int = 0x000
@@ -58,10 +184,16 @@ class CANFrameCommand:
     dlc: int = 8
     comment: str = ""
     
-    def to_can_frame(self) -> CANFrame:
-        """转换为CANFrame对象"""
+    def to_can_frame(self, timestamp: Optional[float] = None) -> CANFrame:
+        """
+        转换为CANFrame对象
+        
+        Args:
+            timestamp: 帧时间戳，批量生成多帧时可传入同一个值以免重复读取时钟；
+                       默认为当前时间（与接收帧一致使用系统时间）
+        """
         return CANFrame(
-            timestamp=time.time(),
+            timestamp=time.time() if timestamp is None else timestamp,
             arbitration_id=self.arbitration_id,
             data=self.data,
             is_extended_id=self.is_extended_id,
@@ -71,17 +203,29 @@ class CANFrameCommand:
             dlc=self.dlc
         )
     
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            'arbitration_id': self.arbitration_id,
+            'data': self.data.hex(),
+            'is_extended_id': self.is_extended_id,
+            'is_fd': self.is_fd,
+            'bitrate_switch': self.bitrate_switch,
+            'error_state_indicator': self.error_state_indicator,
+            'dlc': self.dlc,
+            'comment': self.comment,
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CANFrameCommand':
         """从字典创建"""
-        if isinstance(data.get('data'), str):
-            # 十六进制字符串转bytes
-            hex_str = data['data'].replace(' ', '')
-            data['data'] = bytes.fromhex(hex_str)
-        return cls(**data)
+        kwargs = _init_kwargs(cls, data)
+        kwargs['data'] = _payload_to_bytes(kwargs.get('data', b''))
+        if 'comment' in kwargs:
+            kwargs['comment'] = _intern_str(kwargs['comment'])
+        return cls(**kwargs)
 
-@dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UDSCommand:
     """UDS命令"""
     service_id: int = 0x00
@@ -90,48 +234,95 @@ class UDSCommand:
     timeout: int = 2000
     expect_response: bool = True
     comment: str = ""
+    # 上次生成的UDSRequest及生成时的字段值，字段未变时直接复用
+    _cached_request: Optional[UDSRequest] = field(default=None, init=False, repr=False, compare=False)
+    _cached_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def to_uds_request(self) -> UDSRequest:
         """转换为UDSRequest对象"""
-        return UDSRequest(
-            service_id=self.service_id,
-            data=self.data,
-            subfunction=self.subfunction,
-            timeout=self.timeout,
-            expect_response=self.expect_response
-        )
+        key = (self.service_id, self.data, self.subfunction, self.timeout, self.expect_response)
+        if key != self._cached_key:
+            self._cached_request = UDSRequest(
+                service_id=self.service_id,
+                data=self.data,
+                subfunction=self.subfunction,
+                timeout=self.timeout,
+                expect_response=self.expect_response
+            )
+            self._cached_key = key
+        return self._cached_request
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            'service_id': self.service_id,
+            'data': self.data.hex(),
+            'subfunction': self.subfunction,
+            'timeout': self.timeout,
+            'expect_response': self.expect_response,
+            'comment': self.comment,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UDSCommand':
         """从字典创建"""
-        if isinstance(data.get('data'), str):
-            # 十六进制字符串转bytes
-            hex_str = data['data'].replace(' ', '')
-            data['data'] = bytes.fromhex(hex_str)
-        return cls(**data)
+        kwargs = _init_kwargs(cls, data)
+        kwargs['data'] = _payload_to_bytes(kwargs.get('data', b''))
+        if 'comment' in kwargs:
+            kwargs['comment'] = _intern_str(kwargs['comment'])
+        return cls(**kwargs)
 
-@dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WaitCommand:
     """等待命令"""
     duration: int = 1000  # 毫秒
     comment: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {'duration': self.duration, 'comment': self.comment}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WaitCommand':
+        """从字典创建"""
+        kwargs = _init_kwargs(cls, data)
+        if 'comment' in kwargs:
+            kwargs['comment'] = _intern_str(kwargs['comment'])
+        return cls(**kwargs)
 
-@dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CommentCommand:
     """注释命令"""
     comment: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {'comment': self.comment}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CommentCommand':
+        """从字典创建"""
+        kwargs = _init_kwargs(cls, data)
+        if 'comment' in kwargs:
+            kwargs['comment'] = _intern_str(kwargs['comment'])
+        return cls(**kwargs)
 
-@dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ScriptCommand:
     """脚本命令"""
     script_code: str = ""
     comment: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {'script_code': self.script_code, 'comment': self.comment}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScriptCommand':
+        """从字典创建"""
+        return cls(**_init_kwargs(cls, data))
 
-@dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Command:
     """命令项"""
     id: str
@@ -155,63 +346,83 @@ class Command:
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        data = asdict(self)
-        data['command_type'] = self.command_type.value
-        data['send_mode'] = self.send_mode.value
-        data['status'] = self.status.value
+        # 直接构造字典，避免asdict对子命令的递归深拷贝
+        data = {
+            'id': self.id,
+            'name': self.name,
+            'command_type': _ENUM_VALUES[self.command_type],
+            'send_mode': _ENUM_VALUES[self.send_mode],
+            'period': self.period,
+            'enabled': self.enabled,
+            'status': _ENUM_VALUES[self.status],
+            'last_executed': self.last_executed,
+            'execution_count': self.execution_count,
+            'success_count': self.success_count,
+            'fail_count': self.fail_count,
+        }
         
-        # 清理None值
+        # 只输出存在的子命令
         if self.can_frame:
             data['can_frame'] = self.can_frame.to_dict()
-        else:
-            data.pop('can_frame', None)
-            
         if self.uds_command:
             data['uds_command'] = self.uds_command.to_dict()
-        else:
-            data.pop('uds_command', None)
-            
         if self.wait_command:
             data['wait_command'] = self.wait_command.to_dict()
-        else:
-            data.pop('wait_command', None)
-            
         if self.comment_command:
             data['comment_command'] = self.comment_command.to_dict()
-        else:
-            data.pop('comment_command', None)
-            
         if self.script_command:
             data['script_command'] = self.script_command.to_dict()
-        else:
-            data.pop('script_command', None)
         
         return data
     
+    def update_from(self, other: 'Command') -> None:
+        """从另一个命令复制配置（名称、类型、发送方式和子命令），保留本对象的执行统计"""
+        self.name = other.name
+        self.command_type = other.command_type
+        self.send_mode = other.send_mode
+        self.period = other.period
+        self.enabled = other.enabled
+        self.can_frame = other.can_frame
+        self.uds_command = other.uds_command
+        self.wait_command = other.wait_command
+        self.comment_command = other.comment_command
+        self.script_command = other.script_command
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Command':
         """从字典创建"""
-        # 转换枚举值
-        data['command_type'] = CommandType(data['command_type'])
-        data['send_mode'] = SendMode(data['send_mode'])
-        data['status'] = CommandStatus(data['status'])
+        kwargs = _init_kwargs(cls, data)
+        if 'name' in kwargs:
+            kwargs['name'] = _intern_str(kwargs['name'])
+        
+        # 转换枚举值（未知值交给枚举构造函数报错）
+        value = kwargs['command_type']
+        member = _COMMAND_TYPE_BY_VALUE.get(value)
+        kwargs['command_type'] = member if member is not None else CommandType(value)
+        if 'send_mode' in kwargs:
+            value = kwargs['send_mode']
+            member = _SEND_MODE_BY_VALUE.get(value)
+            kwargs['send_mode'] = member if member is not None else SendMode(value)
+        if 'status' in kwargs:
+            value = kwargs['status']
+            member = _COMMAND_STATUS_BY_VALUE.get(value)
+            kwargs['status'] = member if member is not None else CommandStatus(value)
         
         # 创建子命令对象
-        if data.get('can_frame'):
-            data['can_frame'] = CANFrameCommand.from_dict(data['can_frame'])
-        if data.get('uds_command'):
-            data['uds_command'] = UDSCommand.from_dict(data['uds_command'])
-        if data.get('wait_command'):
-            data['wait_command'] = WaitCommand(**data['wait_command'])
-        if data.get('comment_command'):
-            data['comment_command'] = CommentCommand(**data['comment_command'])
-        if data.get('script_command'):
-            data['script_command'] = ScriptCommand(**data['script_command'])
-        
-        return cls(**data)
+        if kwargs.get('can_frame'):
+            kwargs['can_frame'] = CANFrameCommand.from_dict(kwargs['can_frame'])
+        if kwargs.get('uds_command'):
+            kwargs['uds_command'] = UDSCommand.from_dict(kwargs['uds_command'])
+        if kwargs.get('wait_command'):
+            kwargs['wait_command'] = WaitCommand.from_dict(kwargs['wait_command'])
+        if kwargs.get('comment_command'):
+            kwargs['comment_command'] = CommentCommand.from_dict(kwargs['comment_command'])
+        if kwargs.get('script_command'):
+            kwargs['script_command'] = ScriptCommand.from_dict(kwargs['script_command'])
+        
+        return cls(**kwargs)
 
-@dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CommandGroup:
     """命令组"""
     id: str
@@ -222,28 +433,141 @@ class CommandGroup:
     repeat_count: int = 1  # 重复次数，0表示无限重复
     repeat_interval: int = 1000  # 重复间隔（毫秒）
     run_in_sequence: bool = True  # 是否顺序执行
+    # 命令ID索引和位置索引，commands被外部增删或命令ID被修改后需重建（见get_command和reindex）
+    _index: Dict[str, Command] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _positions: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # 上次重建位置索引后删除的命令数，被删命令之后的位置最多偏大这么多
+    _removed: int = field(default=0, init=False, repr=False, compare=False)
+    # 命令列表或启用状态的修改版本，用于缓存启用的命令
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _enabled_cache: List[Command] = field(default_factory=list, init=False, repr=False, compare=False)
+    _enabled_version: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._rebuild_index()
+    
+    def _rebuild_index(self) -> None:
+        """重建命令ID索引"""
+        self._index = {cmd.id: cmd for cmd in self.commands}
+        self._positions = {cmd.id: i for i, cmd in enumerate(self.commands)}
+        self._removed = 0
+    
+    def _locate(self, command: Command) -> int:
+        """
+        定位命令在commands中的下标
+        
+        删除只会让后续命令前移，因此从记录的位置向前回查至多_removed个元素；
+        找不到（commands被外部调整过顺序）时重建索引
+        """
+        commands = self.commands
+        pos = self._positions.get(command.id)
+        if pos is not None:
+            low = max(pos - self._removed, 0)
+            for i in range(min(pos, len(commands) - 1), low - 1, -1):
+                if commands[i] is command:
+                    if i != pos:
+                        self._positions[command.id] = i
+                    return i
+        
+        self._rebuild_index()
+        return self._positions[command.id]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'enabled': self.enabled,
+            'commands': [command.to_dict() for command in self.commands],
+            'repeat_count': self.repeat_count,
+            'repeat_interval': self.repeat_interval,
+            'run_in_sequence': self.run_in_sequence,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CommandGroup':
+        """从字典创建"""
+        kwargs = _init_kwargs(cls, data)
+        if kwargs.get('commands'):
+            kwargs['commands'] = [Command.from_dict(cmd) for cmd in kwargs['commands']]
+        return cls(**kwargs)
+    
+    def mark_modified(self) -> None:
+        """直接修改commands顺序或命令启用状态后调用，使启用命令缓存失效"""
+        self._version += 1
+    
+    def reindex(self) -> None:
+        """直接修改命令ID后调用，重建命令索引"""
+        self._rebuild_index()
+        self._version += 1
+    
+    def get_enabled_commands(self) -> List[Command]:
+        """获取启用的命令（未修改时返回缓存的列表）"""
+        if self._enabled_version != self._version:
+            self._enabled_cache = [cmd for cmd in self.commands if cmd.enabled]
+            self._enabled_version = self._version
+        return self._enabled_cache
     
     def add_command(self, command: Command) -> None:
         """添加命令"""
+        self._positions[command.id] = len(self.commands)
         self.commands.append(command)
+        self._index[command.id] = command
+        self._version += 1
+    
+    def add_commands(self, commands: List[Command]) -> None:
+        """批量添加命令"""
+        start = len(self.commands)
+        self.commands.extend(commands)
+        for pos, command in enumerate(commands, start):
+            self._positions[command.id] = pos
+            self._index[command.id] = command
+        self._version += 1
     
     def remove_command(self, command_id: str) -> bool:
         """移除命令"""
-        for i, cmd in enumerate(self.commands):
-            if cmd.id == command_id:
-                self.commands.pop(i)
-                return True
-        return False
+        command = self.get_command(command_id)
+        if command is None:
+            return False
+        
+        # 按位置原地删除，不再扫描并复制整个列表
+        del self.commands[self._locate(command)]
+        del self._index[command_id]
+        del self._positions[command_id]
+        self._removed += 1
+        if self._removed > COMMAND_POSITION_REBUILD_THRESHOLD:
+            self._rebuild_index()
+        self._version += 1
+        return True
+    
+    def replace_command(self, command: Command) -> bool:
+        """用同ID的命令替换原命令"""
+        existing = self.get_command(command.id)
+        if existing is None:
+            return False
+        
+        pos = self._locate(existing)
+        self.commands[pos] = command
+        self._index[command.id] = command
+        self._version += 1
+        return True
     
     def get_command(self, command_id: str) -> Optional[Command]:
         """获取命令"""
-        for cmd in self.commands:
-            if cmd.id == command_id:
-                return cmd
-        return None
+        command = self._index.get(command_id)
+        if command is None:
+            # 仅在索引与列表长度不一致（commands被外部增删过）时重建，普通未命中直接返回
+            if len(self._index) != len(self.commands):
+                self._rebuild_index()
+                command = self._index.get(command_id)
+        elif command.id != command_id:
+            # 命中的命令ID已被修改，索引已过期
+            self._rebuild_index()
+            command = self._index.get(command_id)
+        return command
 
-@dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CommandProject:
     """命令工程"""
     id: str
@@ -253,29 +577,170 @@ class CommandProject:
     created_at: float = field(default_factory=time.time)
     updated_at: float = field(default_factory=time.time)
     groups: List[CommandGroup] = field(default_factory=list)
+    parallel_groups: bool = False  # 是否并行执行各组
+    # 组ID索引，groups被外部增删后在查找未命中且数量不一致时重建
+    _index: Dict[str, CommandGroup] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # 组列表的修改版本，用于校验管理器中的组解析缓存
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # 工程内容已修改但updated_at尚未刷新
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    # 界面记录的工程文件路径（不写入工程文件）
+    file_path: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._rebuild_index()
+    
+    def _rebuild_index(self) -> None:
+        """重建组ID索引"""
+        self._index = {group.id: group for group in self.groups}
+    
+    def mark_dirty(self) -> None:
+        """标记工程已修改，updated_at在刷新时统一更新"""
+        self._dirty = True
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'version': self.version,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'groups': [group.to_dict() for group in self.groups],
+            'parallel_groups': self.parallel_groups,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CommandProject':
+        """从字典创建"""
+        kwargs = _init_kwargs(cls, data)
+        if kwargs.get('groups'):
+            kwargs['groups'] = [CommandGroup.from_dict(group) for group in kwargs['groups']]
+        return cls(**kwargs)
     
     def add_group(self, group: CommandGroup) -> None:
         """添加组"""
         self.groups.append(group)
+        self._index[group.id] = group
+        self._version += 1
     
     def remove_group(self, group_id: str) -> bool:
         """移除组"""
-        for i, group in enumerate(self.groups):
-            if group.id == group_id:
-                self.groups.pop(i)
-                return True
-        return False
+        group = self.get_group(group_id)
+        if group is None:
+            return False
+        
+        self.groups = [g for g in self.groups if g is not group]
+        del self._index[group_id]
+        self._version += 1
+        return True
     
     def get_group(self, group_id: str) -> Optional[CommandGroup]:
         """获取组"""
-        for group in self.groups:
-            if group.id == group_id:
-                return group
-        return None
+        group = self._index.get(group_id)
+        if group is None:
+            # 仅在索引与列表长度不一致（groups被外部增删过）时重建，普通未命中直接返回
+            if len(self._index) != len(self.groups):
+                self._rebuild_index()
+                group = self._index.get(group_id)
+        elif group.id != group_id:
+            # 命中的组ID已被修改，索引已过期
+            self._rebuild_index()
+            group = self._index.get(group_id)
+        return group
+
+# 各命令类的构造字段名，from_dict据此筛选输入字典中的已知键
+_COMMAND_FIELDS: Dict[type, frozenset] = {
+    cls: frozenset(f.name for f in fields(cls) if f.init)
+    for cls in (CANFrameCommand, UDSCommand, WaitCommand, CommentCommand,
+                ScriptCommand, Command, CommandGroup, CommandProject)
+}
+
+def _init_kwargs(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """从字典中取出cls的构造参数，忽略未知键"""
+    names = _COMMAND_FIELDS[cls]
+    return {key: value for key, value in data.items() if key in names}
+
+def _noop_callback(*args) -> None:
+    """未设置回调时使用的空操作"""
+
+class _ExecutorCallback:
+    """
+    执行器回调属性
+    
+    赋值时生成带异常保护的分发函数（未设置时为空操作），
+    执行循环直接调用分发函数，无需每次判断回调是否存在
+    """
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.emit_name = '_emit' + name[2:]  # on_xxx -> _emit_xxx
+        self.label = name[3:].replace('_', ' ')
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.__dict__.get(self.name)
+    
+    def __set__(self, obj, func: Optional[Callable]) -> None:
+        obj.__dict__[self.name] = func
+        obj.__dict__[self.emit_name] = self._make_dispatcher(func, obj._callback_lock)
+    
+    def _make_dispatcher(self, func: Optional[Callable], lock: threading.RLock) -> Callable:
+        if func is None:
+            return _noop_callback
+        
+        label = self.label
+        
+        def dispatch(*args):
+            # 并行执行组时回调来自多个线程，逐个调用
+            with lock:
+                try:
+                    func(*args)
+                except Exception as e:
+                    logger.error(f"Error in {label} callback: {e}")
+        
+        return dispatch
+
+class _PeriodicTask:
+    """调度线程中的一个周期性CAN帧发送任务"""
+    __slots__ = ('command', 'can_frame', 'period', 'active', 'sent', 'succeeded', 'last_flush')
+    
+    def __init__(self, command: Command, can_frame: CANFrame, now: float):
+        self.command = command
+        self.can_frame = can_frame
+        # 周期至少1ms，避免调度线程空转
+        self.period = max(command.period, 1) / 1000.0
+        self.active = True
+        # 统计先在任务上累计，定期写回命令对象
+        self.sent = 0
+        self.succeeded = 0
+        self.last_flush = now
 
 class CommandExecutor:
     """命令执行器"""
     
+    # 回调函数属性
+    on_command_started = _ExecutorCallback()
+    on_command_completed = _ExecutorCallback()
+    on_command_failed = _ExecutorCallback()
+    on_group_started = _ExecutorCallback()
+    on_group_completed = _ExecutorCallback()
+    on_project_started = _ExecutorCallback()
+    on_project_completed = _ExecutorCallback()
+    
+    # 可通过set_executor_callbacks设置的回调名称
+    _CALLBACK_ATTRS = frozenset({
+        'on_command_started',
+        'on_command_completed',
+        'on_command_failed',
+        'on_group_started',
+        'on_group_completed',
+        'on_project_started',
+        'on_project_completed',
+    })
+    
     def __init__(self, can_manager: CANInterfaceManager, uds_manager: UDSSessionManager = None):
         """
         初始化命令执行器
@@ -295,6 +760,7 @@ class CommandExecutor:
         self.current_command: Optional[Command] = None
         
         # 回调函数
+        self._callback_lock = threading.RLock()
         self.on_command_started = None
         self.on_command_completed = None
         self.on_command_failed = None
@@ -308,6 +774,22 @@ class CommandExecutor:
         self.periodic_threads: Dict[str, threading.Thread] = {}
         self.stop_event = threading.Event()
         
+        # 命令类型到处理函数的分发表
+        self._dispatch: Dict[CommandType, Callable[[Command], bool]] = {
+            CommandType.CAN_FRAME: self._execute_can_frame_command,
+            CommandType.UDS_COMMAND: self._execute_uds_command,
+            CommandType.WAIT: self._execute_wait_command,
+            CommandType.COMMENT: self._execute_comment_command,
+            CommandType.SCRIPT: self._execute_script_command,
+        }
+        
+        # 周期性CAN帧由一个调度线程统一发送，任务按下次发送时间排成最小堆
+        self._periodic_tasks: Dict[str, _PeriodicTask] = {}
+        self._sched_heap: List[Tuple[float, int, _PeriodicTask]] = []
+        self._sched_seq = itertools.count()
+        self._sched_cv = threading.Condition()
+        self._sched_thread: Optional[threading.Thread] = None
+        
         logger.info("Command executor initialized")
     
     def start_project(self, project: CommandProject, interface_id: str = "default") -> bool:
@@ -331,11 +813,7 @@ class CommandExecutor:
         self.stop_event.clear()
         
         # 调用项目开始回调
-        if self.on_project_started:
-            try:
-                self.on_project_started(project)
-            except Exception as e:
-                logger.error(f"Error in project started callback: {e}")
+        self._emit_project_started(project)
         
         # 启动执行线程
         self.execution_thread = threading.Thread(
@@ -356,10 +834,18 @@ class CommandExecutor:
         self.running = False
         self.stop_event.set()
         
-        # 停止所有周期性线程
+        # 唤醒调度线程，它会在退出前停止所有周期性CAN帧任务
+        with self._sched_cv:
+            sched_thread = self._sched_thread
+            self._sched_cv.notify_all()
+        
+        # 停止调度线程和所有周期性线程（停止事件已唤醒所有线程，共用一个等待时限）
+        deadline = time.monotonic() + 1.0
+        if sched_thread and sched_thread.is_alive():
+            sched_thread.join(timeout=1.0)
         for thread_id, thread in list(self.periodic_threads.items()):
             if thread.is_alive():
-                thread.join(timeout=1.0)
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
             self.periodic_threads.pop(thread_id, None)
         
         # 等待执行线程结束
@@ -384,47 +870,32 @@ class CommandExecutor:
             # 更新项目信息
             project.updated_at = time.time()
             
-            # 执行每个组
-            for group in project.groups:
-                if not group.enabled or self.stop_event.is_set():
-                    continue
-                
-                self.current_group = group
-                
-                # 调用组开始回调
-                if self.on_group_started:
-                    try:
-                        self.on_group_started(group)
-                    except Exception as e:
-                        logger.error(f"Error in group started callback: {e}")
-                
-                # 执行组
-                self._execute_group(group)
-                
-                # 调用组完成回调
-                if self.on_group_completed:
-                    try:
-                        self.on_group_completed(group)
-                    except Exception as e:
-                        logger.error(f"Error in group completed callback: {e}")
-                
-                # 检查是否停止
-                if self.stop_event.is_set():
-                    break
-                
-                # 组间等待（如果设置了重复间隔）
-                if group.repeat_interval > 0 and not self.stop_event.is_set():
-                    time.sleep(group.repeat_interval / 1000.0)
+            if project.parallel_groups:
+                # 各组互不依赖，并行执行
+                self._execute_groups_parallel(project)
+            else:
+                # 依次执行每个组
+                for group in project.groups:
+                    if not group.enabled or self.stop_event.is_set():
+                        continue
+                    
+                    self._run_group(group)
+                    
+                    # 检查是否停止
+                    if self.stop_event.is_set():
+                        break
+                    
+                    # 组间等待（如果设置了重复间隔），停止时立即结束等待
+                    if group.repeat_interval > 0 and self.stop_event.wait(group.repeat_interval * 0.001):
+                        break
             
             # 项目执行完成
             self.running = False
+            with self._sched_cv:
+                self._sched_cv.notify_all()
             
             # 调用项目完成回调
-            if self.on_project_completed:
-                try:
-                    self.on_project_completed(project)
-                except Exception as e:
-                    logger.error(f"Error in project completed callback: {e}")
+            self._emit_project_completed(project)
             
             logger.info(f"Project '{project.name}' execution completed")
             
@@ -432,6 +903,34 @@ class CommandExecutor:
             logger.error(f"Error executing project: {e}")
             self.running = False
     
+    def _execute_groups_parallel(self, project: CommandProject) -> None:
+        """在线程池中并行执行工程的所有启用组"""
+        groups = [group for group in project.groups if group.enabled]
+        if not groups:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(groups),
+                                thread_name_prefix=f"CommandGroup-{project.id}") as pool:
+            futures = [pool.submit(self._run_group, group) for group in groups]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error executing group: {e}")
+    
+    def _run_group(self, group: CommandGroup) -> None:
+        """执行命令组并调用组开始/完成回调"""
+        self.current_group = group
+        
+        # 调用组开始回调
+        self._emit_group_started(group)
+        
+        # 执行组
+        self._execute_group(group)
+        
+        # 调用组完成回调
+        self._emit_group_completed(group)
+    
     def _execute_group(self, group: CommandGroup) -> None:
         """执行命令组"""
         repeat_count = 0
@@ -440,20 +939,16 @@ class CommandExecutor:
             if self.stop_event.is_set():
                 break
             
-            # 执行组内命令
-            for command in group.commands:
-                if not command.enabled or self.stop_event.is_set():
-                    continue
+            # 执行组内启用的命令（组未修改时每轮复用同一列表）
+            for command in group.get_enabled_commands():
+                if self.stop_event.is_set():
+                    break
                 
                 self.current_command = command
                 
                 try:
                     # 调用命令开始回调
-                    if self.on_command_started:
-                        try:
-                            self.on_command_started(command)
-                        except Exception as e:
-                            logger.error(f"Error in command started callback: {e}")
+                    self._emit_command_started(command)
                     
                     # 执行命令
                     success = self._execute_command(command)
@@ -467,21 +962,13 @@ class CommandExecutor:
                         command.success_count += 1
                         
                         # 调用命令完成回调
-                        if self.on_command_completed:
-                            try:
-                                self.on_command_completed(command, None)
-                            except Exception as e:
-                                logger.error(f"Error in command completed callback: {e}")
+                        self._emit_command_completed(command, None)
                     else:
                         command.status = CommandStatus.FAILED
                         command.fail_count += 1
                         
                         # 调用命令失败回调
-                        if self.on_command_failed:
-                            try:
-                                self.on_command_failed(command, "Execution failed")
-                            except Exception as e:
-                                logger.error(f"Error in command failed callback: {e}")
+                        self._emit_command_failed(command, "Execution failed")
                     
                 except Exception as e:
                     logger.error(f"Error executing command '{command.name}': {e}")
@@ -501,19 +988,9 @@ class CommandExecutor:
     def _execute_command(self, command: Command) -> bool:
         """执行单个命令"""
         try:
-            if command.command_type == CommandType.CAN_FRAME and command.can_frame:
-                return self._execute_can_frame_command(command)
-            elif command.command_type == CommandType.UDS_COMMAND and command.uds_command:
-                return self._execute_uds_command(command)
-            elif command.command_type == CommandType.WAIT and command.wait_command:
-                return self._execute_wait_command(command)
-            elif command.command_type == CommandType.COMMENT and command.comment_command:
-                return self._execute_comment_command(command)
-            elif command.command_type == CommandType.SCRIPT and command.script_command:
-                return self._execute_script_command(command)
-            else:
-                logger.warning(f"Unknown or invalid command type: {command.command_type}")
-                return False
+            # 命令类型在加入组（_validate_command）或加载（from_dict）时已校验，
+            # 这里直接分派；各处理函数自行检查子命令是否存在
+            return self._dispatch[command.command_type](command)
                 
         except Exception as e:
             logger.error(f"Error in command execution: {e}")
@@ -532,50 +1009,144 @@ class CommandExecutor:
         if command.send_mode == SendMode.SINGLE:
             # 单次发送
             success = self.can_manager.send_frame(self.interface_id, can_frame)
-            logger.debug(f"Sent CAN frame: ID={can_frame.id_hex}, success={success}")
+            logger.debug("Sent CAN frame: ID=0x%X, success=%s", can_frame.arbitration_id, success)
             return success
             
         elif command.send_mode == SendMode.PERIODIC:
-            # 周期性发送 - 启动后台线程
-            thread = threading.Thread(
-                target=self._periodic_can_frame_sender,
-                args=(command, can_frame),
-                daemon=True,
-                name=f"PeriodicCAN-{command.id}"
-            )
-            self.periodic_threads[command.id] = thread
-            thread.start()
+            # 周期性发送 - 交给调度线程
+            self._schedule_periodic_can_frame(command, can_frame)
             return True
             
         else:
             logger.warning(f"Unsupported send mode for CAN frame: {command.send_mode}")
             return False
     
-    def _periodic_can_frame_sender(self, command: Command, can_frame: CANFrame) -> None:
-        """周期性发送CAN帧"""
-        try:
+    def _schedule_periodic_can_frame(self, command: Command, can_frame: CANFrame) -> None:
+        """将CAN帧加入周期发送调度"""
+        with self._sched_cv:
+            task = self._periodic_tasks.get(command.id)
+            if task is not None and task.active:
+                # 已在周期发送中（如组重复执行），不重复调度
+                return
+            
+            now = time.monotonic()
+            task = _PeriodicTask(command, can_frame, now)
+            self._periodic_tasks[command.id] = task
+            heapq.heappush(self._sched_heap, (now, next(self._sched_seq), task))
             command.status = CommandStatus.RUNNING
             
-            while self.running and not self.stop_event.is_set():
-                # 发送CAN帧
-                success = self.can_manager.send_frame(self.interface_id, can_frame)
+            if self._sched_thread is None:
+                self._sched_thread = threading.Thread(
+                    target=self._periodic_scheduler,
+                    daemon=True,
+                    name="PeriodicCANScheduler"
+                )
+                self._sched_thread.start()
+            else:
+                self._sched_cv.notify()
+    
+    def _periodic_scheduler(self) -> None:
+        """周期性CAN帧调度线程"""
+        # 循环内只访问局部变量
+        heap = self._sched_heap
+        cv = self._sched_cv
+        send_frames = self._get_batch_sender()
+        iface = self.interface_id
+        stop_is_set = self.stop_event.is_set
+        mono = time.monotonic
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        seq = self._sched_seq
+        final_status = CommandStatus.STOPPED
+        
+        cv.acquire()
+        try:
+            while self.running and not stop_is_set():
+                now = mono()
                 
-                # 更新统计
-                command.last_executed = time.time()
-                command.execution_count += 1
-                if success:
-                    command.success_count += 1
-                else:
-                    command.fail_count += 1
+                # 取出合批窗口内到期的所有任务（持有锁）
+                due_tasks = []
+                batch_end = now + PERIODIC_BATCH_WINDOW
+                while heap and heap[0][0] <= batch_end:
+                    due, _, task = heappop(heap)
+                    if not task.active:
+                        # 已停止的任务在此丢弃
+                        continue
+                    due_tasks.append(task)
+                    
+                    # 按截止时间安排下一次发送，发送耗时不会累积成漂移；
+                    # 已落后一个周期以上时跳过错过的周期
+                    due += task.period
+                    if due <= now:
+                        due = now + task.period
+                    heappush(heap, (due, next(seq), task))
+                
+                if due_tasks:
+                    # 同一时刻到期的帧一次批量发送；发送期间释放锁，
+                    # 添加/停止任务不必等待总线I/O
+                    frames = [task.can_frame for task in due_tasks]
+                    cv.release()
+                    try:
+                        results = send_frames(iface, frames)
+                    except Exception as e:
+                        # 单批发送失败只计入失败次数，调度继续
+                        logger.error(f"Error sending periodic CAN frames: {e}")
+                        results = [False] * len(frames)
+                    finally:
+                        cv.acquire()
+                    
+                    for task, success in zip(due_tasks, results):
+                        if not task.active:
+                            # 发送期间已停止，统计已写回
+                            continue
+                        if success:
+                            task.succeeded += 1
+                        task.sent += 1
+                        
+                        if now - task.last_flush >= PERIODIC_STATS_FLUSH_INTERVAL:
+                            self._flush_periodic_stats(task.command, task.sent, task.succeeded)
+                            task.sent = task.succeeded = 0
+                            task.last_flush = now
+                    
+                    # 发送期间可能已请求停止，不再等待
+                    if not self.running or stop_is_set():
+                        break
+                
+                # 等到最早的任务到期，或被新任务/停止请求唤醒
+                cv.wait(max(0.0, heap[0][0] - mono()) if heap else None)
                 
-                # 等待下一个周期
-                time.sleep(command.period / 1000.0)
-            
-            command.status = CommandStatus.STOPPED
-            
         except Exception as e:
-            logger.error(f"Error in periodic CAN frame sender: {e}")
-            command.status = CommandStatus.FAILED
+            logger.error(f"Error in periodic CAN frame scheduler: {e}")
+            final_status = CommandStatus.FAILED
+        finally:
+            for task in self._periodic_tasks.values():
+                task.active = False
+                self._flush_periodic_stats(task.command, task.sent, task.succeeded)
+                task.command.status = final_status
+            self._periodic_tasks.clear()
+            heap.clear()
+            self._sched_thread = None
+            cv.release()
+    
+    def _get_batch_sender(self) -> Callable[[str, List[CANFrame]], List[bool]]:
+        """获取批量发送函数，CAN管理器不支持批量发送时逐帧发送"""
+        send_frames = getattr(self.can_manager, 'send_frames', None)
+        if send_frames is not None:
+            return send_frames
+        
+        send = self.can_manager.send_frame
+        return lambda interface_id, frames: [send(interface_id, frame) for frame in frames]
+    
+    @staticmethod
+    def _flush_periodic_stats(command: Command, sent: int, succeeded: int) -> None:
+        """将周期发送的累计统计写回命令对象"""
+        if not sent:
+            return
+        
+        command.last_executed = time.time()
+        command.execution_count += sent
+        command.success_count += succeeded
+        command.fail_count += sent - succeeded
     
     def _execute_uds_command(self, command: Command) -> bool:
         """执行UDS命令"""
@@ -593,7 +1164,7 @@ class CommandExecutor:
             
             if response:
                 success = response.is_positive
-                logger.debug(f"Sent UDS command: SID=0x{uds_cmd.service_id:02X}, success={success}")
+                logger.debug("Sent UDS command: SID=0x%02X, success=%s", uds_cmd.service_id, success)
                 
                 # 如果命令期望响应但没有收到，视为失败
                 if uds_cmd.expect_response and not response:
@@ -622,21 +1193,29 @@ class CommandExecutor:
     
     def _periodic_uds_command_sender(self, command: Command, uds_request: UDSRequest) -> None:
         """周期性发送UDS命令"""
+        # 循环内只访问局部变量
+        send_request = self.uds_manager.send_request
+        stop_is_set = self.stop_event.is_set
+        stop_wait = self.stop_event.wait
+        now = time.time
+        expect_response = uds_request.expect_response
+        period = command.period / 1000.0
+        
         try:
             command.status = CommandStatus.RUNNING
             
-            while self.running and not self.stop_event.is_set():
+            while self.running and not stop_is_set():
                 # 发送UDS命令
-                response = self.uds_manager.send_request(uds_request)
+                response = send_request(uds_request)
                 
                 # 更新统计
-                command.last_executed = time.time()
+                command.last_executed = now()
                 command.execution_count += 1
                 
                 if response and response.is_positive:
                     command.success_count += 1
                     command.status = CommandStatus.SUCCESS
-                elif not uds_request.expect_response:
+                elif not expect_response:
                     # 不期望响应的情况
                     command.success_count += 1
                     command.status = CommandStatus.SUCCESS
@@ -644,8 +1223,9 @@ class CommandExecutor:
                     command.fail_count += 1
                     command.status = CommandStatus.FAILED
                 
-                # 等待下一个周期
-                time.sleep(command.period / 1000.0)
+                # 等待下一个周期，停止时立即退出
+                if stop_wait(period):
+                    break
             
             command.status = CommandStatus.STOPPED
             
@@ -660,13 +1240,12 @@ class CommandExecutor:
             return False
         
         try:
-            # 计算等待时间（毫秒）
-            wait_time = wait_cmd.duration / 1000.0
-            
-            # 等待指定时间
-            time.sleep(wait_time)
+            # 等待指定时间（毫秒），停止时立即返回；被取消不算失败
+            if self.stop_event.wait(wait_cmd.duration * 0.001):
+                logger.debug("Wait command cancelled: %sms", wait_cmd.duration)
+                return True
             
-            logger.debug(f"Wait command executed: {wait_cmd.duration}ms")
+            logger.debug("Wait command executed: %sms", wait_cmd.duration)
             return True
             
         except Exception as e:
@@ -679,7 +1258,7 @@ class CommandExecutor:
         if not comment_cmd:
             return False
         
-        logger.debug(f"Comment: {comment_cmd.comment}")
+        logger.debug("Comment: %s", comment_cmd.comment)
         return True  # 注释命令总是成功
     
     def _execute_script_command(self, command: Command) -> bool:
@@ -745,12 +1324,23 @@ class CommandExecutor:
             'current_group': self.current_group.name if self.current_group else None,
             'current_command': self.current_command.name if self.current_command else None,
             'periodic_threads': len(self.periodic_threads),
+            'periodic_tasks': len(self._periodic_tasks),
         }
         
         return status
     
     def stop_periodic_command(self, command_id: str) -> bool:
         """停止周期性命令"""
+        with self._sched_cv:
+            task = self._periodic_tasks.pop(command_id, None)
+            if task is not None:
+                # 标记停止，调度线程取到该任务时丢弃
+                task.active = False
+                self._flush_periodic_stats(task.command, task.sent, task.succeeded)
+                task.sent = task.succeeded = 0
+                task.command.status = CommandStatus.STOPPED
+                return True
+        
         if command_id in self.periodic_threads:
             thread = self.periodic_threads.pop(command_id, None)
             if thread and thread.is_alive():
@@ -761,9 +1351,85 @@ class CommandExecutor:
     
     def stop_all_periodic_commands(self) -> None:
         """停止所有周期性命令"""
-        for command_id in list(self.periodic_threads.keys()):
+        for command_id in list(self._periodic_tasks) + list(self.periodic_threads):
             self.stop_periodic_command(command_id)
 
+# 新建命令的模板，调用方需要修改时返回深拷贝
+_CAN_FRAME_COMMAND_TEMPLATE: Dict[str, Any] = {
+    "name": "New CAN Frame",
+    "command_type": _CMD_TYPE_CAN_FRAME,
+    "send_mode": _SEND_MODE_SINGLE,
+    "period": 1000,
+    "enabled": True,
+    "can_frame": {
+        "arbitration_id": 0x7E0,
+        "data": "02 10 01",
+        "is_extended_id": False,
+        "is_fd": False,
+        "comment": "Diagnostic Session Control"
+    }
+}
+
+_UDS_COMMAND_TEMPLATE: Dict[str, Any] = {
+    "name": "New UDS Command",
+    "command_type": _CMD_TYPE_UDS,
+    "send_mode": _SEND_MODE_SINGLE,
+    "period": 1000,
+    "enabled": True,
+    "uds_command": {
+        "service_id": 0x10,
+        "subfunction": 0x01,
+        "data": "",
+        "timeout": 2000,
+        "expect_response": True,
+        "comment": "Enter Diagnostic Session"
+    }
+}
+
+def _template_view(template: Dict[str, Any]) -> Mapping[str, Any]:
+    """生成模板的只读视图（嵌套字典同样只读）"""
+    return MappingProxyType({
+        key: MappingProxyType(value) if isinstance(value, dict) else value
+        for key, value in template.items()
+    })
+
+_CAN_FRAME_COMMAND_TEMPLATE_VIEW = _template_view(_CAN_FRAME_COMMAND_TEMPLATE)
+_UDS_COMMAND_TEMPLATE_VIEW = _template_view(_UDS_COMMAND_TEMPLATE)
+
+# 导出工程模板中固定不变的组列表
+_EXPORT_TEMPLATE_GROUPS: List[Dict[str, Any]] = [
+    {
+        "id": "group1",
+        "name": "ECU Identification",
+        "description": "Read ECU identification information",
+        "enabled": True,
+        "commands": [
+            {
+                "id": "cmd1",
+                "name": "Read VIN",
+                "command_type": _CMD_TYPE_UDS,
+                "send_mode": _SEND_MODE_SINGLE,
+                "uds_command": {
+                    "service_id": 0x22,
+                    "data": "F1 81",
+                    "timeout": 2000,
+                    "comment": "Read Vehicle Identification Number"
+                }
+            }
+        ]
+    }
+]
+
+def _export_template(template_name: str, groups: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """生成导出模板的外层字典"""
+    return {
+        "template_name": template_name,
+        "version": "1.0",
+        "created_at": time.time(),
+        "description": f"{template_name} template",
+        "groups": groups,
+    }
+
 class CommandProjectManager:
     """命令工程管理器"""
     
@@ -779,11 +1445,25 @@ class CommandProjectManager:
         self.uds_manager = uds_manager
         
         # 命令工程存储
-        self.projects: Dict[str, CommandProject] = {}
+        self._projects: Dict[str, CommandProject] = {}
+        # 对外暴露的只读视图，只创建一次，读取时不产生新对象
+        self._projects_view: Mapping[str, CommandProject] = MappingProxyType(self._projects)
         self.current_project_id: Optional[str] = None
         
+        # get_all_projects返回的工程快照，工程增删时置空
+        self._projects_snapshot: Optional[Tuple[CommandProject, ...]] = None
+        
+        # 嵌套事务深度，大于0时工程修改时间延迟到事务结束再刷新
+        self._transaction_depth = 0
+        
+        # (工程ID, 组ID) -> (工程, 工程组列表版本, 组) 的解析缓存
+        self._group_cache: Dict[Tuple[str, str], Tuple[CommandProject, int, CommandGroup]] = {}
+        
         # 命令执行器
         self.executor = CommandExecutor(can_manager, uds_manager)
+        # UI会高频轮询执行器状态，预先绑定方法省去每次的属性查找
+        self._is_running = self.executor.is_running
+        self._get_status = self.executor.get_current_status
         
         # 文件路径
         self.projects_dir = "projects"
@@ -802,9 +1482,9 @@ class CommandProjectManager:
         Returns:
             CommandProject or None: 创建的工程
         """
-        if project_id in self.projects:
+        if project_id in self._projects:
             logger.warning(f"Project '{project_id}' already exists")
-            return self.projects[project_id]
+            return self._projects[project_id]
         
         project = CommandProject(
             id=project_id,
@@ -814,7 +1494,8 @@ class CommandProjectManager:
             updated_at=time.time()
         )
         
-        self.projects[project_id] = project
+        self._projects[project_id] = project
+        self._projects_snapshot = None
         self.current_project_id = project_id
         
         logger.info(f"Created project '{name}' (ID: {project_id})")
@@ -831,8 +1512,8 @@ class CommandProjectManager:
             CommandProject or None: 加载的工程
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _load_json(f.read())
             
             # 验证数据格式
             if 'id' not in data or 'name' not in data:
@@ -843,7 +1524,8 @@ class CommandProjectManager:
             project = CommandProject.from_dict(data)
             
             # 添加到管理器
-            self.projects[project.id] = project
+            self._projects[project.id] = project
+            self._projects_snapshot = None
             self.current_project_id = project.id
             
             logger.info(f"Loaded project '{project.name}' from '{file_path}'")
@@ -864,21 +1546,20 @@ class CommandProjectManager:
         Returns:
             bool: 是否保存成功
         """
-        project = self.get_project(project_id)
-        if not project:
-            logger.error(f"Project '{project_id}' not found")
+        project = self._require_project(project_id)
+        if project is None:
             return False
         
         try:
             # 更新修改时间
             project.updated_at = time.time()
+            project._dirty = False
             
             # 转换为字典
             data = project.to_dict()
             
             # 保存到文件
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json_file(data, file_path)
             
             logger.info(f"Saved project '{project.name}' to '{file_path}'")
             return True
@@ -887,6 +1568,11 @@ class CommandProjectManager:
             logger.error(f"Error saving project to '{file_path}': {e}")
             return False
     
+    @property
+    def projects(self) -> Mapping[str, CommandProject]:
+        """所有工程（工程ID到工程的只读映射，通过create/load/remove_project修改）"""
+        return self._projects_view
+    
     def get_project(self, project_id: str) -> Optional[CommandProject]:
         """
         获取命令工程
@@ -897,12 +1583,28 @@ class CommandProjectManager:
         Returns:
             CommandProject or None: 工程
         """
-        return self.projects.get(project_id)
+        return self._projects.get(project_id)
+    
+    def _require_project(self, project_id: str) -> Optional[CommandProject]:
+        """获取工程，不存在时记录错误"""
+        project = self._projects.get(project_id)
+        if project is None:
+            logger.error("Project '%s' not found", project_id)
+        return project
+    
+    def _require_group(self, project_id: str, group_id: str) -> Tuple[Optional[CommandProject], Optional[CommandGroup]]:
+        """解析工程和组，任一不存在时记录错误"""
+        project, group = self._resolve_group(project_id, group_id)
+        if project is None:
+            logger.error("Project '%s' not found", project_id)
+        elif group is None:
+            logger.error("Group '%s' not found in project '%s'", group_id, project_id)
+        return project, group
     
     def get_current_project(self) -> Optional[CommandProject]:
         """获取当前工程"""
         if self.current_project_id:
-            return self.projects.get(self.current_project_id)
+            return self._projects.get(self.current_project_id)
         return None
     
     def remove_project(self, project_id: str) -> bool:
@@ -915,7 +1617,7 @@ class CommandProjectManager:
         Returns:
             bool: 是否移除成功
         """
-        if project_id not in self.projects:
+        if project_id not in self._projects:
             return False
         
         # 如果正在执行，先停止
@@ -923,7 +1625,9 @@ class CommandProjectManager:
             self.executor.stop_project()
         
         # 移除工程
-        del self.projects[project_id]
+        del self._projects[project_id]
+        self._projects_snapshot = None
+        self._group_cache.clear()
         
         # 如果移除的是当前工程，清空当前工程ID
         if self.current_project_id == project_id:
@@ -943,9 +1647,8 @@ class CommandProjectManager:
         Returns:
             bool: 是否启动成功
         """
-        project = self.get_project(project_id)
-        if not project:
-            logger.error(f"Project '{project_id}' not found")
+        project = self._require_project(project_id)
+        if project is None:
             return False
         
         return self.executor.start_project(project, interface_id)
@@ -966,27 +1669,66 @@ class CommandProjectManager:
         Returns:
             bool: 是否创建成功
         """
-        project = self.get_project(project_id)
-        if not project:
-            logger.error(f"Project '{project_id}' not found")
-            return False
-        
-        group = project.get_group(group_id)
-        if not group:
-            logger.error(f"Group '{group_id}' not found in project '{project_id}'")
-            return False
+        return self.create_commands(project_id, group_id, [command])[0]
+    
+    def create_commands(self, project_id: str, group_id: str, commands: List[Command]) -> List[bool]:
+        """
+        批量创建命令
         
-        # 检查命令ID是否已存在
-        for existing_cmd in group.commands:
-            if existing_cmd.id == command.id:
-                logger.warning(f"Command '{command.id}' already exists in group '{group_id}'")
-                return False
+        工程和组只解析一次，ID已存在（或在本批中重复）的命令被跳过
         
-        group.add_command(command)
-        project.updated_at = time.time()
+        Args:
+            project_id: 工程ID
+            group_id: 组ID
+            commands: 命令列表
+            
+        Returns:
+            list: 每个命令是否创建成功
+        """
+        project, group = self._require_group(project_id, group_id)
+        if group is None:
+            return [False] * len(commands)
+        
+        # 直接使用组的命令ID索引判断是否已存在（commands被外部增删过时先重建）
+        index = group._index
+        if len(index) != len(group.commands):
+            group.reindex()
+            index = group._index
+        
+        # 与索引键视图求交找出组内已存在的命令ID，统一报告
+        dupes = index.keys() & {cmd.id for cmd in commands}
+        if dupes:
+            logger.warning(f"Commands already exist in group '{group_id}': {', '.join(sorted(dupes))}")
+        
+        # 本批中已接受的命令ID，用于发现批内重复
+        batch_ids: Set[str] = set()
+        to_add: List[Command] = []
+        results: List[bool] = []
+        for command in commands:
+            if command.id in index or command.id in batch_ids:
+                if command.id not in dupes:
+                    # 与本批中之前的命令ID重复
+                    logger.warning(f"Duplicate command '{command.id}' in batch for group '{group_id}'")
+                results.append(False)
+                continue
+            if not self._validate_command(command):
+                results.append(False)
+                continue
+            batch_ids.add(command.id)
+            _normalize_payloads(command)
+            to_add.append(command)
+            results.append(True)
+        
+        if to_add:
+            group.add_commands(to_add)
+            self._touch(project)
+            
+            if len(to_add) == 1:
+                logger.debug("Created command '%s' in group '%s'", to_add[0].name, group.name)
+            else:
+                logger.debug("Created %d commands in group '%s'", len(to_add), group.name)
         
-        logger.debug(f"Created command '{command.name}' in group '{group.name}'")
-        return True
+        return results
     
     def update_command(self, project_id: str, group_id: str, command: Command) -> bool:
         """
@@ -1000,22 +1742,22 @@ class CommandProjectManager:
         Returns:
             bool: 是否更新成功
         """
-        project = self.get_project(project_id)
-        if not project:
+        project, group = self._resolve_group(project_id, group_id)
+        if not group:
             return False
         
-        group = project.get_group(group_id)
-        if not group:
+        # 在原命令对象上就地更新，保持外部引用有效
+        existing = group.get_command(command.id)
+        if existing is None or not self._validate_command(command):
             return False
         
-        # 查找并替换命令
-        for i, existing_cmd in enumerate(group.commands):
-            if existing_cmd.id == command.id:
-                group.commands[i] = command
-                project.updated_at = time.time()
-                return True
+        _normalize_payloads(command)
+        if existing is not command:
+            existing.update_from(command)
+        group.mark_modified()
         
-        return False
+        self._touch(project)
+        return True
     
     def delete_command(self, project_id: str, group_id: str, command_id: str) -> bool:
         """
@@ -1029,98 +1771,177 @@ class CommandProjectManager:
         Returns:
             bool: 是否删除成功
         """
-        project = self.get_project(project_id)
-        if not project:
+        project, group = self._resolve_group(project_id, group_id)
+        if not group:
             return False
         
-        group = project.get_group(group_id)
-        if not group:
+        if not group.remove_command(command_id):
             return False
         
-        return group.remove_command(command_id)
+        self._touch(project)
+        return True
+    
+    def _validate_command(self, command: Command) -> bool:
+        """
+        检查命令的类型、发送方式和周期是否合法
+        
+        只在命令加入或更新时检查一次，执行器发送时不再重复检查
+        """
+        if command.command_type not in _COMMAND_TYPE_SET:
+            logger.error(f"Invalid command type for command '{command.id}': {command.command_type!r}")
+            return False
+        if command.send_mode not in _SEND_MODE_SET:
+            logger.error(f"Invalid send mode for command '{command.id}': {command.send_mode!r}")
+            return False
+        period = command.period
+        if type(period) is not int or period < 0:
+            logger.error(f"Invalid period for command '{command.id}': {period!r}")
+            return False
+        return True
+    
+    def _touch(self, project: CommandProject) -> None:
+        """标记工程已修改，不在事务中时立即刷新修改时间"""
+        project.mark_dirty()
+        if self._transaction_depth == 0:
+            self.flush()
+    
+    def flush(self) -> None:
+        """将所有已修改工程的updated_at更新为当前时间（只读取一次时钟）"""
+        now = None
+        for project in self._projects.values():
+            if project._dirty:
+                if now is None:
+                    now = time.time()
+                project.updated_at = now
+                project._dirty = False
+    
+    @contextmanager
+    def transaction(self) -> Iterator['CommandProjectManager']:
+        """
+        批量修改事务，期间的修改只标记工程，退出最外层事务时统一刷新修改时间
+        
+        用法:
+            with manager.transaction():
+                manager.update_command(...)
+        """
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.flush()
+    
+    def _resolve_group(self, project_id: str, group_id: str) -> Tuple[Optional[CommandProject], Optional[CommandGroup]]:
+        """
+        解析工程和组
+        
+        结果按(工程ID, 组ID)缓存，工程被替换或其组列表变化后缓存自动失效
+        
+        Returns:
+            tuple: (工程或None, 组或None)
+        """
+        key = (project_id, group_id)
+        cached = self._group_cache.get(key)
+        if cached is not None:
+            project, version, group = cached
+            if project._version == version and self._projects.get(project_id) is project:
+                return project, group
+        
+        project = self._projects.get(project_id)
+        if project is None:
+            return None, None
+        
+        group = project.get_group(group_id)
+        if group is not None:
+            if len(self._group_cache) >= GROUP_CACHE_SIZE:
+                self._group_cache.clear()
+            self._group_cache[key] = (project, project._version, group)
+        return project, group
     
-    def get_all_projects(self) -> List[CommandProject]:
-        """获取所有工程"""
-        return list(self.projects.values())
+    def get_all_projects(self) -> Sequence[CommandProject]:
+        """获取所有工程（返回缓存的只读快照，工程增删后重建）"""
+        snapshot = self._projects_snapshot
+        if snapshot is None:
+            snapshot = self._projects_snapshot = tuple(self._projects.values())
+        return snapshot
     
     def get_executor_status(self) -> Dict[str, Any]:
         """获取执行器状态"""
-        return self.executor.get_current_status()
+        return self._get_status()
     
     def is_executor_running(self) -> bool:
         """检查执行器是否正在运行"""
-        return self.executor.is_running()
+        return self._is_running()
     
     def set_executor_callbacks(self, **callbacks) -> None:
         """设置执行器回调函数"""
-        for callback_name, callback_func in callbacks.items():
-            if hasattr(self.executor, callback_name):
-                setattr(self.executor, callback_name, callback_func)
+        if callbacks:
+            self.set_callbacks(callbacks.items())
+    
+    def set_callbacks(self, pairs: Iterable[Tuple[str, Optional[Callable]]]) -> None:
+        """
+        按(回调名称, 回调函数)对设置执行器回调函数，不需要构造关键字参数字典
+        
+        Args:
+            pairs: (回调名称, 回调函数)对
+        """
+        valid_names = CommandExecutor._CALLBACK_ATTRS
+        executor = self.executor
+        for callback_name, callback_func in pairs:
+            if callback_name in valid_names:
+                setattr(executor, callback_name, callback_func)
+            else:
+                logger.warning(f"Unknown executor callback '{callback_name}'")
     
     def create_can_frame_command_template(self) -> Dict[str, Any]:
         """创建CAN帧命令模板"""
-        return {
-            "name": "New CAN Frame",
-            "command_type": CommandType.CAN_FRAME.value,
-            "send_mode": SendMode.SINGLE.value,
-            "period": 1000,
-            "enabled": True,
-            "can_frame": {
-                "arbitration_id": 0x7E0,
-                "data": "02 10 01",
-                "is_extended_id": False,
-                "is_fd": False,
-                "comment": "Diagnostic Session Control"
-            }
-        }
+        return copy.deepcopy(_CAN_FRAME_COMMAND_TEMPLATE)
     
     def create_uds_command_template(self) -> Dict[str, Any]:
         """创建UDS命令模板"""
-        return {
-            "name": "New UDS Command",
-            "command_type": CommandType.UDS_COMMAND.value,
-            "send_mode": SendMode.SINGLE.value,
-            "period": 1000,
-            "enabled": True,
-            "uds_command": {
-                "service_id": 0x10,
-                "subfunction": 0x01,
-                "data": "",
-                "timeout": 2000,
-                "expect_response": True,
-                "comment": "Enter Diagnostic Session"
-            }
-        }
+        return copy.deepcopy(_UDS_COMMAND_TEMPLATE)
+    
+    def get_can_frame_command_template_view(self) -> Mapping[str, Any]:
+        """获取CAN帧命令模板的只读视图（只读取时无需复制）"""
+        return _CAN_FRAME_COMMAND_TEMPLATE_VIEW
+    
+    def get_uds_command_template_view(self) -> Mapping[str, Any]:
+        """获取UDS命令模板的只读视图（只读取时无需复制）"""
+        return _UDS_COMMAND_TEMPLATE_VIEW
     
     def export_project_template(self, template_name: str) -> Dict[str, Any]:
         """导出工程模板"""
-        template = {
-            "template_name": template_name,
-            "version": "1.0",
-            "created_at": time.time(),
-            "description": f"{template_name} template",
-            "groups": [
-                {
-                    "id": "group1",
-                    "name": "ECU Identification",
-                    "description": "Read ECU identification information",
-                    "enabled": True,
-                    "commands": [
-                        {
-                            "id": "cmd1",
-                            "name": "Read VIN",
-                            "command_type": CommandType.UDS_COMMAND.value,
-                            "send_mode": SendMode.SINGLE.value,
-                            "uds_command": {
-                                "service_id": 0x22,
-                                "data": "F1 81",
-                                "timeout": 2000,
-                                "comment": "Read Vehicle Identification Number"
-                            }
-                        }
-                    ]
-                }
-            ]
-        }
+        # 只有外层字段随调用变化，组列表复制一份交给调用方
+        return _export_template(template_name, copy.deepcopy(_EXPORT_TEMPLATE_GROUPS))
+    
+    def export_project_template_bytes(self, template_name: str) -> bytes:
+        """导出工程模板为UTF-8编码的JSON（有orjson时由其直接生成bytes）"""
+        return _dump_json(_export_template(template_name, _EXPORT_TEMPLATE_GROUPS))
+    
+    def export_project_template_to(self, fp: Union[str, BinaryIO], template_name: str) -> bool:
+        """
+        导出工程模板并写入文件
+        
+        Args:
+            fp: 文件路径或以二进制模式打开的文件对象
+            template_name: 模板名称
+            
+        Returns:
+            bool: 是否导出成功
+        """
+        # 序列化只读取组列表，直接使用共享的模板组
+        template = _export_template(template_name, _EXPORT_TEMPLATE_GROUPS)
         
-        return template
\ No newline at end of file
+        try:
+            if isinstance(fp, str):
+                _write_json_file(template, fp)
+            else:
+                _write_json(template, fp)
+            
+            logger.info(f"Exported template '{template_name}'")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error exporting template '{template_name}': {e}")
+            return False
\ No newline at end of file
@@ -5,11 +5,13 @@ ISO-TP协议实现 - 基于ISO 15765-2:2022标准
 支持CAN FD和标准CAN，完整实现UDS over CAN协议
 """
 
+import sys
 import logging
 import time
 import threading
 import queue
 import struct
+from collections import deque
 from enum import IntEnum, Enum
 from typing import Optional, Dict, List, Any, Tuple, Union, Callable
 from dataclasses import dataclass, field
@@ -19,6 +21,9 @@ from .can_interface import CANFrame, CANInterfaceManager
 
 logger = logging.getLogger(__name__)
 
+# Python 3.10+ 的数据类支持slots，旧版本退回普通数据类
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class ISOTPFrameType(IntEnum):
     """ISO-TP帧类型"""
     SINGLE_FRAME = 0x00
@@ -32,6 +37,37 @@ class ISOTPFlowStatus(IntEnum):
     WAIT = 0x01      # 等待
     OVERFLOW = 0x02  # 溢出
 
+# 流控制状态值到成员的查找表（按值索引）
+_FLOW_STATUS_BY_VALUE: Tuple[ISOTPFlowStatus, ...] = tuple(sorted(ISOTPFlowStatus))
+
+# 连续帧PCI字节表（序列号 -> PCI字节），编码时直接查表
+_CF_PCI_BY_SEQUENCE: Tuple[int, ...] = tuple(
+    (ISOTPFrameType.CONSECUTIVE_FRAME << 4) | sequence_number for sequence_number in range(16)
+)
+
+# 标准CAN和CAN FD的DLC表（DLC -> 该DLC可承载的最大字节数）
+_STANDARD_DLC_TABLE: Dict[int, int] = {
+    0: 0, 1: 1, 2: 2, 3: 3, 4: 4,
+    5: 5, 6: 6, 7: 7, 8: 8
+}
+_FD_DLC_TABLE: Dict[int, int] = {
+    0: 0, 1: 1, 2: 2, 3: 3, 4: 4,
+    5: 5, 6: 6, 7: 7, 8: 8,
+    9: 12, 10: 16, 11: 20, 12: 24,
+    13: 32, 14: 48, 15: 64
+}
+
+def _build_dlc_lookup(dlc_table: Dict[int, int]) -> Tuple[int, ...]:
+    """生成按数据长度索引的DLC查找表"""
+    return tuple(
+        next(dlc for dlc, max_length in dlc_table.items() if length <= max_length)
+        for length in range(max(dlc_table.values()) + 1)
+    )
+
+# 数据长度 -> DLC，编码时直接索引
+_STANDARD_DLC_BY_LENGTH = _build_dlc_lookup(_STANDARD_DLC_TABLE)
+_FD_DLC_BY_LENGTH = _build_dlc_lookup(_FD_DLC_TABLE)
+
 class ISOTPAddressingMode(Enum):
     """ISO-TP寻址模式"""
     NORMAL = "normal"      # 正常模式 (11/29位ID)
@@ -93,7 +129,7 @@ class ISOTPConfig:
             return False
         return True
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ISOTPFrame:
     """ISO-TP帧"""
     frame_type: ISOTPFrameType
@@ -144,6 +180,98 @@ class ISOTPFrameError(ISOTPError):
     """ISO-TP帧错误"""
     pass
 
+class _FrameQueue:
+    """
+    ISO-TP内部的收发队列
+    
+    基于deque和两个共享同一把锁的条件变量，提供queue.Queue的常用接口
+    （put/get/put_nowait/get_nowait/qsize/empty/full），队列满或空时同样抛出
+    queue.Full/queue.Empty；另提供put_many在一次加锁内放入多项
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._items = deque()
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+    
+    def _wait(self, cond: threading.Condition, ready: Callable[[], bool],
+              block: bool, timeout: Optional[float], error: type) -> None:
+        """在持有锁时等待条件满足，按queue.Queue的语义处理阻塞和超时"""
+        if ready():
+            return
+        if not block:
+            raise error
+        if timeout is None:
+            while not ready():
+                cond.wait()
+        elif timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        else:
+            endtime = time.monotonic() + timeout
+            while not ready():
+                remaining = endtime - time.monotonic()
+                if remaining <= 0.0:
+                    raise error
+                cond.wait(remaining)
+    
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """放入一项，队列满时按block/timeout等待"""
+        with self._not_full:
+            if self.maxsize > 0:
+                self._wait(self._not_full, lambda: len(self._items) < self.maxsize,
+                           block, timeout, queue.Full)
+            self._items.append(item)
+            self._not_empty.notify()
+    
+    def put_nowait(self, item: Any) -> None:
+        """不等待地放入一项"""
+        self.put(item, block=False)
+    
+    def put_many(self, items: List[Any]) -> None:
+        """一次加锁放入多项，剩余空间不足时退回逐项阻塞放入"""
+        count = len(items)
+        with self._not_full:
+            if self.maxsize <= 0 or len(self._items) + count <= self.maxsize:
+                self._items.extend(items)
+                self._not_empty.notify(count)
+                return
+        
+        for item in items:
+            self.put(item)
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """取出一项，队列空时按block/timeout等待"""
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: bool(self._items), block, timeout, queue.Empty)
+            item = self._items.popleft()
+            if self.maxsize > 0:
+                self._not_full.notify()
+            return item
+    
+    def get_nowait(self) -> Any:
+        """不等待地取出一项"""
+        return self.get(block=False)
+    
+    def clear(self) -> None:
+        """清空队列"""
+        with self._not_full:
+            self._items.clear()
+            self._not_full.notify_all()
+    
+    def qsize(self) -> int:
+        """队列中的项数"""
+        return len(self._items)
+    
+    def empty(self) -> bool:
+        """队列是否为空"""
+        return not self._items
+    
+    def full(self) -> bool:
+        """队列是否已满"""
+        return 0 < self.maxsize <= len(self._items)
+
 class ISOTPProtocol:
     """ISO-TP协议处理器"""
     
@@ -169,6 +297,7 @@ class ISOTPProtocol:
         # 接收状态
         self.rx_buffer = bytearray()
         self.rx_expected_length = 0
+        self._rx_offset = 0  # rx_buffer中已写入的字节数
         self.rx_sequence = 0
         self.rx_next_sequence = 1
         self.rx_block_counter = 0
@@ -177,12 +306,10 @@ class ISOTPProtocol:
         self.rx_flow_block_size = 0
         self.rx_last_time = 0
         
-        # 定时器
-        self.timer_lock = threading.RLock()
-        self.timer_start_time = 0
-        self.timer_running = False
-        self.timer_thread = None
-        self.timer_stop_event = threading.Event()
+        # 定时器：只记录单调时钟截止时间，由process_can_frame和receive_data检查，
+        # 不再为每次发送创建定时线程
+        self.timer_start_time = 0.0
+        self._deadline = 0.0  # 0表示定时器未运行
         
         # 回调函数
         self.on_data_received = None
@@ -191,11 +318,38 @@ class ISOTPProtocol:
         
         # 线程同步
         self.lock = threading.RLock()
-        self.rx_queue = queue.Queue(maxsize=1000)
-        self.tx_queue = queue.Queue(maxsize=1000)
+        self.rx_queue = _FrameQueue(maxsize=1000)
+        self.tx_queue = _FrameQueue(maxsize=1000)
+        
+        # 解码分派表，按PCI高4位（帧类型）索引
+        self._decode_dispatch: Tuple[Callable[[bytes, int], Optional[ISOTPFrame]], ...] = (
+            self._decode_single_frame,
+            self._decode_first_frame,
+            self._decode_consecutive_frame,
+            self._decode_flow_control_frame,
+        ) + (self._decode_unknown_frame,) * 12
+        
+        # 发送连续帧时复用的ISO-TP帧对象（只在编码时读取，不会传出协议对象）
+        self._cf_frame = ISOTPFrame(frame_type=ISOTPFrameType.CONSECUTIVE_FRAME, data=b'')
+        
+        # 由配置派生的常量
+        self._refresh_config_cache()
         
         logger.info(f"ISO-TP protocol initialized with config: {config}")
     
+    def _refresh_config_cache(self) -> None:
+        """根据配置计算发送路径上用到的常量（修改config后需重新调用）"""
+        config = self.config
+        self._is_fd = config.can_fd_enabled
+        self._is_extended_id = (config.frame_type == "extended")
+        # 单帧/第一帧/连续帧可携带的数据长度（减去PCI字节）
+        self._max_sf_payload = 64 if self._is_fd else 7
+        self._max_ff_payload = 64 if self._is_fd else 6
+        self._max_cf_payload = 64 if self._is_fd else 7
+        # 标准CAN/CAN FD的整帧填充模板，编码时整块复制后再写入PCI和数据
+        self._pad_template_std = bytes((config.tx_padding_value,)) * 8
+        self._pad_template_fd = bytes((config.tx_padding_value,)) * 64
+    
     def reset(self) -> None:
         """重置协议状态"""
         with self.lock:
@@ -213,6 +367,7 @@ class ISOTPProtocol:
             # 重置接收状态
             self.rx_buffer.clear()
             self.rx_expected_length = 0
+            self._rx_offset = 0
             self.rx_sequence = 0
             self.rx_next_sequence = 1
             self.rx_block_counter = 0
@@ -225,11 +380,7 @@ class ISOTPProtocol:
             self.stop_timer()
             
             # 清空队列
-            while not self.rx_queue.empty():
-                try:
-                    self.rx_queue.get_nowait()
-                except queue.Empty:
-                    break
+            self.rx_queue.clear()
             
             logger.debug("ISO-TP protocol reset")
     
@@ -247,67 +398,78 @@ class ISOTPProtocol:
         try:
             if is_fd:
                 max_payload = 64  # CAN FD最大载荷
-                dlc_table = self._get_fd_dlc_table()
+                dlc_by_length = _FD_DLC_BY_LENGTH
             else:
                 max_payload = 8   # 标准CAN最大载荷
-                dlc_table = self._get_standard_dlc_table()
+                dlc_by_length = _STANDARD_DLC_BY_LENGTH
             
-            if isotp_frame.is_single_frame:
+            # 连续帧最频繁，最先判断
+            if isotp_frame.is_consecutive_frame:
+                # 连续帧
+                data = isotp_frame.data
+                data_length = len(data)
+                buf = self._new_frame_buffer(1 + data_length, max_payload)
+                buf[0] = _CF_PCI_BY_SEQUENCE[isotp_frame.sequence_number & 0x0F]
+                buf[1:1 + data_length] = data
+                
+            elif isotp_frame.is_single_frame:
                 # 单帧
-                data_length = len(isotp_frame.data)
+                data = isotp_frame.data
+                data_length = len(data)
                 if data_length <= max_payload - 1:  # 1字节用于PCI
                     # 使用标准单帧格式
-                    pci = (ISOTPFrameType.SINGLE_FRAME << 4) | data_length
-                    frame_data = bytes([pci]) + isotp_frame.data
+                    buf = self._new_frame_buffer(1 + data_length, max_payload)
+                    buf[0] = (ISOTPFrameType.SINGLE_FRAME << 4) | data_length
+                    buf[1:1 + data_length] = data
                 else:
                     # 使用扩展单帧格式 (仅CAN FD支持)
                     if not is_fd or data_length > 4095:
                         raise ISOTPFrameError(f"Data too long for single frame: {data_length}")
                     
-                    pci_byte1 = (ISOTPFrameType.SINGLE_FRAME << 4) | 0x00
-                    pci_byte2 = data_length >> 8
-                    pci_byte3 = data_length & 0xFF
-                    frame_data = bytes([pci_byte1, pci_byte2, pci_byte3]) + isotp_frame.data
+                    buf = self._new_frame_buffer(3 + data_length, max_payload)
+                    buf[0] = (ISOTPFrameType.SINGLE_FRAME << 4) | 0x00
+                    buf[1:3] = data_length.to_bytes(2, 'big')
+                    buf[3:3 + data_length] = data
                 
             elif isotp_frame.is_first_frame:
                 # 第一帧
-                data_length = len(isotp_frame.data)
+                data = isotp_frame.data
+                data_length = len(data)
                 if data_length > self.config.max_frame_size:
                     raise ISOTPFrameError(f"Data too long: {data_length}")
                 
                 if data_length <= 0xFFF:  # 12位长度
-                    pci_byte1 = (ISOTPFrameType.FIRST_FRAME << 4) | (data_length >> 8)
-                    pci_byte2 = data_length & 0xFF
-                    frame_data = bytes([pci_byte1, pci_byte2]) + isotp_frame.data
+                    buf = self._new_frame_buffer(2 + data_length, max_payload)
+                    buf[0] = (ISOTPFrameType.FIRST_FRAME << 4) | (data_length >> 8)
+                    buf[1] = data_length & 0xFF
+                    buf[2:2 + data_length] = data
                 else:  # 扩展长度 (仅CAN FD)
                     if not is_fd:
                         raise ISOTPFrameError("Extended length only supported in CAN FD")
                     
-                    pci_byte1 = (ISOTPFrameType.FIRST_FRAME << 4) | 0x00
-                    pci_byte2 = data_length >> 8
-                    pci_byte3 = data_length & 0xFF
-                    frame_data = bytes([pci_byte1, pci_byte2, pci_byte3]) + isotp_frame.data
-                
-            elif isotp_frame.is_consecutive_frame:
-                # 连续帧
-                sequence_number = isotp_frame.sequence_number & 0x0F
-                pci = (ISOTPFrameType.CONSECUTIVE_FRAME << 4) | sequence_number
-                frame_data = bytes([pci]) + isotp_frame.data
+                    buf = self._new_frame_buffer(3 + data_length, max_payload)
+                    buf[0] = (ISOTPFrameType.FIRST_FRAME << 4) | 0x00
+                    buf[1:3] = data_length.to_bytes(2, 'big')
+                    buf[3:3 + data_length] = data
                 
             elif isotp_frame.is_flow_control_frame:
                 # 流控制帧
-                pci = (ISOTPFrameType.FLOW_CONTROL_FRAME << 4) | isotp_frame.flow_status
-                frame_data = bytes([pci, isotp_frame.block_size, isotp_frame.st_min])
+                buf = self._new_frame_buffer(3, max_payload)
+                buf[0] = (ISOTPFrameType.FLOW_CONTROL_FRAME << 4) | isotp_frame.flow_status
+                buf[1] = isotp_frame.block_size
+                buf[2] = isotp_frame.st_min
             else:
                 raise ISOTPFrameError(f"Unknown frame type: {isotp_frame.frame_type}")
             
-            # 填充数据 (如果需要)
-            if self.config.tx_padding and len(frame_data) < max_payload:
-                padding = bytes([self.config.tx_padding_value] * (max_payload - len(frame_data)))
-                frame_data += padding
+            frame_data = bytes(buf)
             
             # 计算DLC
-            dlc = self._calculate_dlc(len(frame_data), is_fd, dlc_table)
+            frame_length = len(frame_data)
+            if frame_length < len(dlc_by_length):
+                dlc = dlc_by_length[frame_length]
+            else:
+                # 数据长度超过最大值，返回最大DLC
+                dlc = dlc_by_length[-1]
             
             return frame_data, dlc
             
@@ -315,6 +477,16 @@ class ISOTPProtocol:
             logger.error(f"Error encoding ISO-TP frame: {e}")
             raise
     
+    def _new_frame_buffer(self, used_length: int, max_payload: int) -> bytearray:
+        """
+        分配一帧的CAN数据缓冲区
+        
+        需要填充时直接复制整帧填充模板，调用方只需覆盖前used_length字节
+        """
+        if self.config.tx_padding and used_length < max_payload:
+            return bytearray(self._pad_template_fd if max_payload == 64 else self._pad_template_std)
+        return bytearray(used_length)
+    
     def decode_frame(self, can_data: bytes, is_fd: bool = False) -> Optional[ISOTPFrame]:
         """
         解码CAN数据为ISO-TP帧
@@ -330,82 +502,72 @@ class ISOTPProtocol:
             if not can_data:
                 return None
             
-            # 获取PCI字节
+            # 按PCI高4位（帧类型）查表分派
             pci_byte = can_data[0]
-            frame_type = (pci_byte >> 4) & 0x0F
-            pci_low = pci_byte & 0x0F
-            
-            if frame_type == ISOTPFrameType.SINGLE_FRAME:
-                # 单帧
-                if pci_low == 0x00:
-                    # 扩展单帧格式 (仅CAN FD)
-                    if len(can_data) < 3:
-                        return None
-                    data_length = (can_data[1] << 8) | can_data[2]
-                    data = can_data[3:3+data_length]
-                else:
-                    # 标准单帧格式
-                    data_length = pci_low
-                    data = can_data[1:1+data_length]
-                
-                return ISOTPFrame(
-                    frame_type=ISOTPFrameType.SINGLE_FRAME,
-                    data=data
-                )
-                
-            elif frame_type == ISOTPFrameType.FIRST_FRAME:
-                # 第一帧
-                if pci_low == 0x00:
-                    # 扩展长度格式
-                    if len(can_data) < 4:
-                        return None
-                    data_length = (can_data[1] << 8) | can_data[2]
-                    data = can_data[3:]
-                else:
-                    # 标准长度格式
-                    data_length = ((pci_low & 0x0F) << 8) | can_data[1]
-                    data = can_data[2:]
-                
-                return ISOTPFrame(
-                    frame_type=ISOTPFrameType.FIRST_FRAME,
-                    data=data,
-                    sequence_number=0
-                )
-                
-            elif frame_type == ISOTPFrameType.CONSECUTIVE_FRAME:
-                # 连续帧
-                sequence_number = pci_low
-                data = can_data[1:]
-                
-                return ISOTPFrame(
-                    frame_type=ISOTPFrameType.CONSECUTIVE_FRAME,
-                    data=data,
-                    sequence_number=sequence_number
-                )
-                
-            elif frame_type == ISOTPFrameType.FLOW_CONTROL_FRAME:
-                # 流控制帧
-                if len(can_data) < 3:
-                    return None
-                
-                flow_status = ISOTPFlowStatus(pci_low)
-                block_size = can_data[1]
-                st_min = can_data[2]
-                
-                return ISOTPFrame(
-                    frame_type=ISOTPFrameType.FLOW_CONTROL_FRAME,
-                    data=b'',
-                    flow_status=flow_status,
-                    block_size=block_size,
-                    st_min=st_min
-                )
-            
-            return None
+            return self._decode_dispatch[pci_byte >> 4](can_data, pci_byte & 0x0F)
             
         except Exception as e:
             logger.error(f"Error decoding ISO-TP frame: {e}")
             return None
     
+    def _decode_single_frame(self, can_data: bytes, pci_low: int) -> Optional[ISOTPFrame]:
+        """解码单帧"""
+        if pci_low == 0x00:
+            # 扩展单帧格式 (仅CAN FD)
+            if len(can_data) < 3:
+                return None
+            data_length = int.from_bytes(can_data[1:3], 'big')
+            data = can_data[3:3+data_length]
+        else:
+            # 标准单帧格式
+            data = can_data[1:1+pci_low]
+        
+        return ISOTPFrame(frame_type=ISOTPFrameType.SINGLE_FRAME, data=data)
+    
+    def _decode_first_frame(self, can_data: bytes, pci_low: int) -> Optional[ISOTPFrame]:
+        """解码第一帧"""
+        if pci_low == 0x00:
+            # 扩展长度格式
+            if len(can_data) < 4:
+                return None
+            data = can_data[3:]
+        else:
+            # 标准长度格式
+            if len(can_data) < 2:
+                return None
+            data = can_data[2:]
+        
+        return ISOTPFrame(frame_type=ISOTPFrameType.FIRST_FRAME, data=data, sequence_number=0)
+    
+    def _decode_consecutive_frame(self, can_data: bytes, pci_low: int) -> Optional[ISOTPFrame]:
+        """解码连续帧"""
+        return ISOTPFrame(
+            frame_type=ISOTPFrameType.CONSECUTIVE_FRAME,
+            data=can_data[1:],
+            sequence_number=pci_low
+        )
+    
+    def _decode_flow_control_frame(self, can_data: bytes, pci_low: int) -> Optional[ISOTPFrame]:
+        """解码流控制帧"""
+        if len(can_data) < 3:
+            return None
+        
+        if pci_low >= len(_FLOW_STATUS_BY_VALUE):
+            logger.error(f"Error decoding ISO-TP frame: {pci_low} is not a valid ISOTPFlowStatus")
+            return None
+        
+        return ISOTPFrame(
+            frame_type=ISOTPFrameType.FLOW_CONTROL_FRAME,
+            data=b'',
+            flow_status=_FLOW_STATUS_BY_VALUE[pci_low],
+            block_size=can_data[1],
+            st_min=can_data[2]
+        )
+    
+    def _decode_unknown_frame(self, can_data: bytes, pci_low: int) -> Optional[ISOTPFrame]:
+        """未定义的帧类型"""
+        return None
+    
     def send_data(self, data: bytes, callback: Optional[Callable] = None) -> bool:
         """
         发送数据
@@ -417,6 +579,9 @@ class ISOTPProtocol:
         Returns:
             bool: 是否成功启动发送
         """
+        # 先处理已到期的定时器，避免因过期状态拒绝发送
+        self.check_timeout()
+        
         with self.lock:
             if self.state != ISOTPState.IDLE:
                 logger.warning(f"Cannot send data in state: {self.state}")
@@ -433,14 +598,14 @@ class ISOTPProtocol:
             self.tx_sequence = 0
             self.tx_next_frame_index = 0
             self.tx_block_counter = 0
-            self.tx_last_time = time.time()
+            self.tx_last_time = time.monotonic()
             
             # 设置回调
             if callback:
                 self.on_transmission_complete = callback
             
             # 根据数据长度选择发送方式
-            max_payload = 64 if self.config.can_fd_enabled else 7  # 减去PCI字节
+            max_payload = self._max_sf_payload
             
             if len(data) <= max_payload:
                 # 单帧传输
@@ -450,9 +615,10 @@ class ISOTPProtocol:
                 # 多帧传输
                 self.state = ISOTPState.WAITING_FOR_FC
                 self._send_first_frame(data)
-            
-            # 启动定时器
-            self.start_timer(self.config.p2_timeout / 1000.0)
+                
+                # 仍在等待流控制帧时才启动定时器（单帧发送已完成）
+                if self.state == ISOTPState.WAITING_FOR_FC:
+                    self.start_timer(self.config.p2_timeout / 1000.0)
             
             logger.debug(f"Started sending data, length: {len(data)}, multi-frame: {len(data) > max_payload}")
             return True
@@ -461,6 +627,8 @@ class ISOTPProtocol:
         """
         接收数据
         
+        等待期间定时器到期时会按时处理传输层超时
+        
         Args:
             timeout: 超时时间 (秒)
             
@@ -471,9 +639,22 @@ class ISOTPProtocol:
             if timeout is None:
                 timeout = self.config.receive_timeout / 1000.0
             
-            return self.rx_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+            end = time.monotonic() + timeout
+            while True:
+                self.check_timeout()
+                now = time.monotonic()
+                wait = end - now
+                deadline = self._deadline
+                if deadline and deadline - now < wait:
+                    # 先等到定时器截止时间，处理超时后继续等待
+                    wait = deadline - now
+                
+                try:
+                    return self.rx_queue.get(timeout=max(wait, 0.0))
+                except queue.Empty:
+                    if time.monotonic() >= end:
+                        self.check_timeout()
+                        return None
         except Exception as e:
             logger.error(f"Error receiving data: {e}")
             return None
@@ -489,6 +670,10 @@ class ISOTPProtocol:
             bool: 是否成功处理
         """
         try:
+            # 顺带检查传输层定时器
+            if self._deadline:
+                self.check_timeout()
+            
             # 检查CAN ID
             if can_frame.arbitration_id != self.config.rx_id:
                 return False
@@ -524,7 +709,7 @@ class ISOTPProtocol:
         )
         
         # 编码并发送
-        frame_data, dlc = self.encode_frame(isotp_frame, self.config.can_fd_enabled)
+        frame_data, dlc = self.encode_frame(isotp_frame, self._is_fd)
         
         # 将帧放入发送队列
         try:
@@ -532,8 +717,8 @@ class ISOTPProtocol:
                 timestamp=time.time(),
                 arbitration_id=self.config.tx_id,
                 data=frame_data,
-                is_extended_id=(self.config.frame_type == "extended"),
-                is_fd=self.config.can_fd_enabled,
+                is_extended_id=self._is_extended_id,
+                is_fd=self._is_fd,
                 dlc=dlc
             )
             
@@ -562,7 +747,7 @@ class ISOTPProtocol:
     def _send_first_frame(self, data: bytes) -> None:
         """发送第一帧"""
         # 计算第一帧的最大数据长度
-        max_payload = 64 if self.config.can_fd_enabled else 6  # 减去PCI字节
+        max_payload = self._max_ff_payload
         
         # 确保不超过最大长度
         first_frame_data = data[:max_payload]
@@ -573,15 +758,15 @@ class ISOTPProtocol:
         )
         
         # 编码并发送
-        frame_data, dlc = self.encode_frame(isotp_frame, self.config.can_fd_enabled)
+        frame_data, dlc = self.encode_frame(isotp_frame, self._is_fd)
         
         try:
             can_frame = CANFrame(
                 timestamp=time.time(),
                 arbitration_id=self.config.tx_id,
                 data=frame_data,
-                is_extended_id=(self.config.frame_type == "extended"),
-                is_fd=self.config.can_fd_enabled,
+                is_extended_id=self._is_extended_id,
+                is_fd=self._is_fd,
                 dlc=dlc
             )
             
@@ -601,50 +786,70 @@ class ISOTPProtocol:
     
     def _send_consecutive_frame(self) -> None:
         """发送连续帧"""
+        self._send_consecutive_block(1)
+    
+    def _send_consecutive_block(self, count: int) -> None:
+        """
+        连续发送最多count个连续帧
+        
+        先在本地编码整块帧并更新局部状态，再一次性放入发送队列，
+        避免每帧单独获取队列锁
+        """
         if self.tx_remaining <= 0:
             logger.warning("No data remaining to send")
             return
         
         # 计算连续帧的最大数据长度
-        max_payload = 64 if self.config.can_fd_enabled else 7  # 减去PCI字节
+        is_fd = self._is_fd
+        max_payload = self._max_cf_payload
+        is_extended_id = self._is_extended_id
+        tx_id = self.config.tx_id
         
-        # 获取数据
+        tx_buffer = self.tx_buffer
+        total_length = self.tx_total_length
         start = self.tx_next_frame_index
-        end = min(start + max_payload, self.tx_total_length)
-        frame_data = self.tx_buffer[start:end]
-        
-        isotp_frame = ISOTPFrame(
-            frame_type=ISOTPFrameType.CONSECUTIVE_FRAME,
-            data=frame_data,
-            sequence_number=self.tx_sequence
-        )
-        
-        # 编码并发送
-        can_frame_data, dlc = self.encode_frame(isotp_frame, self.config.can_fd_enabled)
+        remaining = self.tx_remaining
+        sequence = self.tx_sequence
+        isotp_frame = self._cf_frame
+        encode_frame = self.encode_frame
+        frames: List[CANFrame] = []
         
         try:
-            can_frame = CANFrame(
-                timestamp=time.time(),
-                arbitration_id=self.config.tx_id,
-                data=can_frame_data,
-                is_extended_id=(self.config.frame_type == "extended"),
-                is_fd=self.config.can_fd_enabled,
-                dlc=dlc
-            )
+            timestamp = time.time()
+            while count > 0 and remaining > 0:
+                end = min(start + max_payload, total_length)
+                isotp_frame.data = tx_buffer[start:end]
+                isotp_frame.sequence_number = sequence
+                
+                # 编码
+                can_frame_data, dlc = encode_frame(isotp_frame, is_fd)
+                frames.append(CANFrame(
+                    timestamp=timestamp,
+                    arbitration_id=tx_id,
+                    data=can_frame_data,
+                    is_extended_id=is_extended_id,
+                    is_fd=is_fd,
+                    dlc=dlc
+                ))
+                
+                remaining -= end - start
+                start = end
+                sequence = (sequence + 1) & 0x0F
+                count -= 1
             
-            self.tx_queue.put(can_frame)
+            self.tx_queue.put_many(frames)
             
             # 更新状态
-            self.tx_next_frame_index = end
-            self.tx_remaining -= len(frame_data)
-            self.tx_sequence = (self.tx_sequence + 1) & 0x0F
-            self.tx_block_counter += 1
-            self.tx_last_time = time.time()
+            self.tx_next_frame_index = start
+            self.tx_remaining = remaining
+            self.tx_sequence = sequence
+            self.tx_block_counter += len(frames)
+            self.tx_last_time = time.monotonic()
             
-            logger.debug(f"Consecutive frame {self.tx_sequence-1} sent, remaining: {self.tx_remaining}")
+            logger.debug("%d consecutive frame(s) sent, remaining: %d", len(frames), remaining)
             
             # 检查是否完成
-            if self.tx_remaining <= 0:
+            if remaining <= 0:
                 self.state = ISOTPState.IDLE
                 self.tx_buffer.clear()
                 self.tx_total_length = 0
@@ -675,15 +880,15 @@ class ISOTPProtocol:
         )
         
         # 编码并发送
-        frame_data, dlc = self.encode_frame(isotp_frame, self.config.can_fd_enabled)
+        frame_data, dlc = self.encode_frame(isotp_frame, self._is_fd)
         
         try:
             can_frame = CANFrame(
                 timestamp=time.time(),
                 arbitration_id=self.config.tx_id,
                 data=frame_data,
-                is_extended_id=(self.config.frame_type == "extended"),
-                is_fd=self.config.can_fd_enabled,
+                is_extended_id=self._is_extended_id,
+                is_fd=self._is_fd,
                 dlc=dlc
             )
             
@@ -718,11 +923,13 @@ class ISOTPProtocol:
             # 计算总长度
             if len(isotp_frame.data) >= 2:
                 # 从第一帧数据中提取长度
-                length_bytes = isotp_frame.data[:2]
-                self.rx_expected_length = (length_bytes[0] << 8) | length_bytes[1]
+                self.rx_expected_length = int.from_bytes(isotp_frame.data[:2], 'big')
                 
-                # 保存数据
-                self.rx_buffer = bytearray(isotp_frame.data[2:])
+                # 按总长度预分配接收缓冲区，后续连续帧直接写入对应位置
+                self.rx_buffer = bytearray(self.rx_expected_length)
+                initial = memoryview(isotp_frame.data)[2:2 + self.rx_expected_length]
+                self.rx_buffer[:len(initial)] = initial
+                self._rx_offset = len(initial)
             else:
                 logger.error("Invalid first frame data")
                 return False
@@ -732,7 +939,7 @@ class ISOTPProtocol:
             self.rx_sequence = 0
             self.rx_next_sequence = 1
             self.rx_block_counter = 0
-            self.rx_last_time = time.time()
+            self.rx_last_time = time.monotonic()
             
             # 发送流控制帧
             self._send_flow_control_frame(
@@ -767,25 +974,32 @@ class ISOTPProtocol:
                 self.state = ISOTPState.ERROR
                 return False
             
-            # 添加数据到缓冲区
-            self.rx_buffer.extend(isotp_frame.data)
+            # 写入预分配的缓冲区，超出总长度的部分（填充字节）直接丢弃
+            offset = self._rx_offset
+            data = isotp_frame.data
+            n = min(len(data), self.rx_expected_length - offset)
+            if n > 0:
+                self.rx_buffer[offset:offset + n] = memoryview(data)[:n]
+                offset += n
+                self._rx_offset = offset
             
             # 更新序列号
             self.rx_sequence = isotp_frame.sequence_number
             self.rx_next_sequence = (self.rx_next_sequence + 1) & 0x0F
             self.rx_block_counter += 1
-            self.rx_last_time = time.time()
+            self.rx_last_time = time.monotonic()
             
             # 检查是否完成
-            if len(self.rx_buffer) >= self.rx_expected_length:
-                # 接收完成
-                received_data = bytes(self.rx_buffer[:self.rx_expected_length])
+            if offset >= self.rx_expected_length:
+                # 接收完成（缓冲区正好是完整数据，无需切片）
+                received_data = bytes(self.rx_buffer)
                 self.rx_queue.put(received_data)
                 
                 # 重置状态
                 self.state = ISOTPState.IDLE
                 self.rx_buffer.clear()
                 self.rx_expected_length = 0
+                self._rx_offset = 0
                 
                 # 停止定时器
                 self.stop_timer()
@@ -824,12 +1038,10 @@ class ISOTPProtocol:
                 self.rx_flow_st_min = isotp_frame.st_min
                 self.tx_block_counter = 0
                 
-                # 发送第一组连续帧
-                for _ in range(min(isotp_frame.block_size, self.tx_remaining)):
-                    if self.tx_remaining > 0:
-                        self._send_consecutive_frame()
-                    else:
-                        break
+                # 发送第一组连续帧（整块一次放入发送队列）
+                block_count = min(isotp_frame.block_size, self.tx_remaining)
+                if block_count > 0:
+                    self._send_consecutive_block(block_count)
                 
                 # 重启定时器
                 self.start_timer(self.config.p2_timeout / 1000.0)
@@ -858,60 +1070,54 @@ class ISOTPProtocol:
             return False
     
     def start_timer(self, timeout: float) -> None:
-        """启动定时器"""
-        with self.timer_lock:
-            if self.timer_running:
-                self.stop_timer()
-            
-            self.timer_start_time = time.time()
-            self.timer_running = True
-            self.timer_stop_event.clear()
-            
-            self.timer_thread = threading.Thread(
-                target=self._timer_thread_func,
-                args=(timeout,),
-                daemon=True
-            )
-            self.timer_thread.start()
+        """启动定时器（设置截止时间）"""
+        self.timer_start_time = time.monotonic()
+        self._deadline = self.timer_start_time + timeout
     
     def stop_timer(self) -> None:
         """停止定时器"""
-        with self.timer_lock:
-            self.timer_running = False
-            self.timer_stop_event.set()
-            
-            if self.timer_thread and self.timer_thread.is_alive():
-                self.timer_thread.join(timeout=0.1)
-                self.timer_thread = None
+        self._deadline = 0.0
     
-    def _timer_thread_func(self, timeout: float) -> None:
-        """定时器线程函数"""
-        try:
-            while self.timer_running and not self.timer_stop_event.is_set():
-                elapsed = time.time() - self.timer_start_time
-                
-                if elapsed >= timeout:
-                    # 超时处理
-                    with self.lock:
-                        if self.timer_running:
-                            self.state = ISOTPState.TIMEOUT
-                            
-                            # 重置状态
-                            self.reset()
-                            
-                            # 调用错误回调
-                            if self.on_error:
-                                self.on_error(f"Timeout after {elapsed:.2f}s")
-                            
-                            logger.warning(f"ISO-TP timeout after {elapsed:.2f}s")
-                    
-                    break
-                
-                # 休眠一段时间
-                time.sleep(0.01)
-                
-        except Exception as e:
-            logger.error(f"Timer thread error: {e}")
+    @property
+    def timer_running(self) -> bool:
+        """定时器是否在运行"""
+        return self._deadline > 0.0
+    
+    def check_timeout(self) -> bool:
+        """
+        检查定时器是否到期，到期时重置协议并通知错误
+        
+        Returns:
+            bool: 是否发生超时
+        """
+        deadline = self._deadline
+        if not deadline or time.monotonic() < deadline:
+            return False
+        
+        with self.lock:
+            # 加锁后重新检查，定时器可能已被其他线程停止或重启
+            deadline = self._deadline
+            now = time.monotonic()
+            if not deadline or now < deadline:
+                return False
+            
+            if self.state == ISOTPState.IDLE:
+                # 传输已结束，过期的定时器不再重置协议，避免清空尚未读取的接收数据
+                self.stop_timer()
+                return False
+            
+            elapsed = now - self.timer_start_time
+            self.state = ISOTPState.TIMEOUT
+            
+            # 重置状态
+            self.reset()
+            
+            # 调用错误回调
+            if self.on_error:
+                self.on_error(f"Timeout after {elapsed:.2f}s")
+            
+            logger.warning(f"ISO-TP timeout after {elapsed:.2f}s")
+            return True
     
     def _calculate_dlc(self, data_length: int, is_fd: bool, dlc_table: Dict[int, int]) -> int:
         """计算DLC值"""
@@ -924,29 +1130,22 @@ class ISOTPProtocol:
     
     def _get_standard_dlc_table(self) -> Dict[int, int]:
         """获取标准CAN DLC表"""
-        return {
-            0: 0, 1: 1, 2: 2, 3: 3, 4: 4,
-            5: 5, 6: 6, 7: 7, 8: 8
-        }
+        return dict(_STANDARD_DLC_TABLE)
     
     def _get_fd_dlc_table(self) -> Dict[int, int]:
         """获取CAN FD DLC表"""
-        return {
-            0: 0, 1: 1, 2: 2, 3: 3, 4: 4,
-            5: 5, 6: 6, 7: 7, 8: 8,
-            9: 12, 10: 16, 11: 20, 12: 24,
-            13: 32, 14: 48, 15: 64
-        }
+        return dict(_FD_DLC_TABLE)
     
     def get_state(self) -> ISOTPState:
-        """获取当前状态"""
+        """获取当前状态（已到期的定时器先按超时处理）"""
+        self.check_timeout()
         return self.state
     
-    def get_tx_queue(self) -> queue.Queue:
+    def get_tx_queue(self) -> _FrameQueue:
         """获取发送队列"""
         return self.tx_queue
     
-    def get_rx_queue(self) -> queue.Queue:
+    def get_rx_queue(self) -> _FrameQueue:
         """获取接收队列"""
         return self.rx_queue
     
@@ -959,7 +1158,7 @@ class ISOTPProtocol:
             'tx_sequence': self.tx_sequence,
             'tx_block_counter': self.tx_block_counter,
             'rx_expected_length': self.rx_expected_length,
-            'rx_buffer_length': len(self.rx_buffer),
+            'rx_buffer_length': self._rx_offset,
             'rx_sequence': self.rx_sequence,
             'rx_block_counter': self.rx_block_counter,
             'timer_running': self.timer_running,
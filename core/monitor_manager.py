@@ -824,7 +824,7 @@ class MonitorService:
         results = {}
         interfaces = self.can_manager.get_all_interfaces()
         
-        for interface_id in interfaces:
+        for interface_id in list(interfaces):
             results[interface_id] = self.start_monitoring(interface_id)
         
         return results
@@ -999,6 +999,7 @@ class CommandProjectWidget(QWidget):
             # 重新生成命令ID
             for command in new_group.commands:
                 command.id = str(uuid.uuid4())[:8]
+            new_group.reindex()
             
             # 添加到工程
             self.current_project.add_group(new_group)
@@ -1240,6 +1241,7 @@ class CommandProjectWidget(QWidget):
             command.send_mode = self.send_mode_combo.currentData()
             command.period = self.period_spin.value()
             command.enabled = self.enabled_check.isChecked()
+            group.mark_modified()
             
             # 更新命令特定数据
             if command.command_type == CommandType.CAN_FRAME:
@@ -1432,6 +1434,7 @@ class CommandProjectWidget(QWidget):
                     for cmd in group.commands:
                         if cmd.id == command_id:
                             cmd.enabled = not cmd.enabled
+                            group.mark_modified()
                             
                             # 更新列表项
                             text = list_item.text()
@@ -1478,6 +1481,7 @@ class CommandProjectWidget(QWidget):
                         # 交换位置
                         if i > 0:
                             group.commands[i], group.commands[i-1] = group.commands[i-1], group.commands[i]
+                            group.mark_modified()
                             
                             # 更新列表
                             self.update_command_list(group.id)
@@ -1511,6 +1515,7 @@ class CommandProjectWidget(QWidget):
                         # 交换位置
                         if i < len(group.commands) - 1:
                             group.commands[i], group.commands[i+1] = group.commands[i+1], group.commands[i]
+                            group.mark_modified()
                             
                             # 更新列表
                             self.update_command_list(group.id)
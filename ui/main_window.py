@@ -13,7 +13,7 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QTabWidget, QToolBar, QAction, QStatusBar,
                             QMessageBox, QSplitter, QMenu, QMenuBar,
                             QApplication, QLabel, QDockWidget, QFrame)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize, QSettings
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize, QSettings, QByteArray
 from PyQt5.QtGui import QIcon, QKeySequence, QCloseEvent
 
 from .can_setting_dialog import CANSettingDialog
@@ -517,10 +517,10 @@ class MainWindow(QMainWindow):
             user_settings = self.config_manager.user_settings
             
             if user_settings.get('window_geometry'):
-                self.restoreGeometry(user_settings['window_geometry'])
+                self.restoreGeometry(QByteArray.fromHex(user_settings['window_geometry'].encode('ascii')))
             
             if user_settings.get('window_state'):
-                self.restoreState(user_settings['window_state'])
+                self.restoreState(QByteArray.fromHex(user_settings['window_state'].encode('ascii')))
             
             # 加载其他设置
             theme = user_settings.get('theme', 'light')
@@ -533,9 +533,9 @@ class MainWindow(QMainWindow):
     def save_settings(self):
         """保存设置"""
         try:
-            # 保存窗口状态
-            self.config_manager.user_settings['window_geometry'] = self.saveGeometry()
-            self.config_manager.user_settings['window_state'] = self.saveState()
+            # 保存窗口状态（以十六进制字符串保存，便于安全序列化）
+            self.config_manager.user_settings['window_geometry'] = bytes(self.saveGeometry().toHex()).decode('ascii')
+            self.config_manager.user_settings['window_state'] = bytes(self.saveState().toHex()).decode('ascii')
             
             # 保存配置
             self.config_manager.save_config()
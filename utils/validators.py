@@ -5,11 +5,18 @@
 """
 
 import re
+import json
 import struct
 import ipaddress
 from typing import Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
+# 优先使用orjson解析JSON
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .constants import *
 
 logger = __import__('logging').getLogger(__name__)
@@ -885,8 +892,8 @@ def validate_json_data(json_str: str, schema: Dict = None) -> Tuple[bool, Option
         return False, None, "JSON数据不能为空"
     
     try:
-        import json
-        data = json.loads(json_str)
+        # orjson.JSONDecodeError是json.JSONDecodeError的子类，下面的异常处理对两者都适用
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
         
         # 如果提供了schema，验证schema
         if schema: